@@ -7,12 +7,20 @@ import json
 import requests
 import time
 import uuid
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping
 from dataclasses import dataclass
 import logging
 import yaml
 from pathlib import Path
 
+# Optional Aho-Corasick matcher for intent keywords
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -29,11 +37,24 @@ class FlowConfig:
 class FlowiseManager:
     """Agentic Flywheel Flowise Manager"""
     
+    # Number of recent questions whose classified intent is remembered
+    INTENT_CACHE_SIZE = 4096
+    
     def __init__(self, base_url: str = "https://beagle-emerging-gnu.ngrok-free.app", flow_registry_path: Optional[str] = None):
         self.base_url = base_url
         self.flow_registry_path = flow_registry_path
-        self.flows: Dict[str, FlowConfig] = {}
+        self._flows: Dict[str, FlowConfig] = {}
         self._load_flows_from_registry()
+    
+    @property
+    def flows(self) -> Mapping[str, FlowConfig]:
+        """Loaded flows by key (read-only: use add_flow so the intent index stays current)"""
+        return MappingProxyType(self._flows)
+    
+    def add_flow(self, flow_key: str, flow_config: FlowConfig):
+        """Register or replace a flow and refresh the intent index"""
+        self._flows[flow_key] = flow_config
+        self.refresh_intent_index()
 
     def _load_flows_from_registry(self):
         """Load flows from flow-registry.yaml"""
@@ -52,12 +73,12 @@ class FlowiseManager:
                     with open(registry_path, 'r') as f:
                         registry = yaml.safe_load(f)
                     
-                    self.flows = {}
+                    self._flows = {}
                     for flow_type in ['operational_flows', 'routing_flows']:
                         for flow_key, flow_config in registry.get(flow_type, {}).items():
                             # Only load active flows for FlowiseManager
                             if flow_config.get('active', 0) == 1:
-                                self.flows[flow_key] = FlowConfig(
+                                self._flows[flow_key] = FlowConfig(
                                     id=flow_config['id'],
                                     name=flow_config['name'],
                                     description=flow_config['description'],
@@ -73,6 +94,33 @@ class FlowiseManager:
         
         if not loaded:
             logger.warning("❌ Flow registry not found. No flows loaded.")
+        
+        self.refresh_intent_index()
+    
+    def refresh_intent_index(self):
+        """Precompute the keyword lookups used by classify_intent
+        
+        Call after editing a flow's ``intent_keywords`` in place; add_flow does this itself.
+        Also clears the memoized classifications.
+        """
+        # Keywords shared by several flows are only searched for once per question
+        self._intent_keywords = frozenset(
+            keyword for flow_config in self.flows.values() for keyword in flow_config.intent_keywords
+        )
+        self._intent_index = [
+            (flow_name, tuple(flow_config.intent_keywords))
+            for flow_name, flow_config in self.flows.items()
+        ]
+        # With pyahocorasick, one pass over the question finds every keyword
+        self._intent_automaton = None
+        if ahocorasick is not None and self._intent_keywords and "" not in self._intent_keywords:
+            automaton = ahocorasick.Automaton()
+            for keyword in self._intent_keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._intent_automaton = automaton
+        # Classification is pure given the index, so memoize it per lowercased question
+        self._classify_lowered = lru_cache(maxsize=self.INTENT_CACHE_SIZE)(self._classify_lowered_question)
 
     def generate_session_id(self, prefix: str = "session") -> str:
         """Generate unique session ID"""
@@ -82,18 +130,25 @@ class FlowiseManager:
     
     def classify_intent(self, question: str):
         """Classify user intent based on question content"""
-        question_lower = question.lower()
+        return self._classify_lowered(question.lower())
+    
+    def _classify_lowered_question(self, question_lower: str) -> str:
+        """Uncached classification of an already lowercased question"""
+        if self._intent_automaton is not None:
+            matched = frozenset(keyword for _, keyword in self._intent_automaton.iter(question_lower))
+        else:
+            # Substring-search each distinct keyword once
+            matched = frozenset(keyword for keyword in self._intent_keywords if keyword in question_lower)
         
-        # Score each flow based on keyword matches
-        scores = {}
-        for flow_name, flow_config in self.flows.items():
-            score = sum(1 for keyword in flow_config.intent_keywords 
-                       if keyword in question_lower)
-            scores[flow_name] = score
+        # Score each flow based on keyword matches, keeping the first highest scorer
+        best_flow, best_score = None, 0
+        for flow_name, keywords in self._intent_index:
+            score = sum(1 for keyword in keywords if keyword in matched)
+            if score > best_score:
+                best_flow, best_score = flow_name, score
         
         # Return the flow with highest score, default to creative-orientation
-        best_flow = max(scores.items(), key=lambda x: x[1])
-        return best_flow[0] if best_flow[1] > 0 else "creative-orientation"
+        return best_flow if best_flow is not None else "creative-orientation"
     
     def adaptive_query(self, 
                       question: str, 
@@ -104,14 +159,16 @@ class FlowiseManager:
         """
         Intelligently route and configure flowise query
         """
-        # Determine flow and configuration
-        if flow_override:
-            flow_config = self._get_flow_by_id(flow_override)
-            if not flow_config:
-                logger.warning(f"Flow override '{flow_override}' not found, using intent-based selection")
-                flow_config = self._select_flow_by_intent(question, intent)
-        else:
-            flow_config = self._select_flow_by_intent(question, intent)
+        # Only classify when an explicit flow or intent does not decide the flow;
+        # the result is reused for the response metadata
+        detected_intent = None
+        flow_config = self._get_flow_by_id(flow_override) if flow_override else None
+        if flow_override and not flow_config:
+            logger.warning(f"Flow override '{flow_override}' not found, using intent-based selection")
+        if not flow_config:
+            if not (intent and intent in self.flows):
+                detected_intent = self.classify_intent(question)
+            flow_config = self._select_flow_by_intent(question, intent, detected_intent)
         
         # Generate session ID if not provided
         if not session_id:
@@ -151,7 +208,7 @@ class FlowiseManager:
                 "flow_used": flow_config.name,
                 "flow_id": flow_config.id,
                 "session_id": session_id,
-                "intent_detected": self.classify_intent(question),
+                "intent_detected": detected_intent if detected_intent is not None else self.classify_intent(question),
                 "config_used": config
             }
             
@@ -172,13 +229,18 @@ class FlowiseManager:
                 return flow_config
         return None
     
-    def _select_flow_by_intent(self, question: str, intent: Optional[str]) -> FlowConfig:
-        """Select flow based on intent or question analysis"""
+    def _select_flow_by_intent(self, question: str, intent: Optional[str],
+                               detected_intent: Optional[str] = None) -> FlowConfig:
+        """Select flow based on intent or question analysis
+        
+        ``detected_intent`` is a classify_intent(question) result the caller already has.
+        """
         if intent and intent in self.flows:
             return self.flows[intent]
         
         # Auto-classify intent
-        detected_intent = self.classify_intent(question)
+        if detected_intent is None:
+            detected_intent = self.classify_intent(question)
         return self.flows[detected_intent]
     
     def list_flows(self) -> Dict[str, Dict[str, Any]]:
@@ -345,6 +407,11 @@ class DomainSpecificFlowiseManager(FlowiseManager):
         self.working_flows_cache = None
         self.context_builder = ContextBuilder()
         
+        # Lowercased domain keywords, matched against every question in classify_intent_with_context
+        self._domain_keywords_lower = tuple(
+            keyword.lower() for keyword in (domain_context.specialized_keywords or [])
+        ) if domain_context else ()
+        
         # Add domain-specific keywords to intent classification if provided
         if domain_context and domain_context.specialized_keywords:
             self._enhance_intent_keywords(domain_context.specialized_keywords)
@@ -359,6 +426,8 @@ class DomainSpecificFlowiseManager(FlowiseManager):
                 flow_config.intent_keywords.extend([kw for kw in specialized_keywords if any(creative in kw.lower() for creative in ["vision", "strategic", "improve", "enhance", "design"])])
             elif flow_name == "faith2story":
                 flow_config.intent_keywords.extend([kw for kw in specialized_keywords if any(content in kw.lower() for content in ["content", "story", "cultural", "lesson", "narrative"])])
+        
+        self.refresh_intent_index()
     
     def discover_working_flows(self) -> Dict[str, bool]:
         """Test all flows to identify which ones are operational"""
@@ -460,11 +529,10 @@ class DomainSpecificFlowiseManager(FlowiseManager):
             question_lower = question.lower()
             
             # Check for domain-specific patterns
-            domain_score = sum(1 for keyword in self.domain_context.specialized_keywords 
-                             if keyword.lower() in question_lower)
+            domain_match = any(keyword in question_lower for keyword in self._domain_keywords_lower)
             
             # If domain keywords are present, we might adjust the intent
-            if domain_score > 0:
+            if domain_match:
                 # Prefer technical-analysis for implementation questions in technical domains
                 if any(tech in question_lower for tech in ["implement", "code", "how to", "api", "database"]):
                     return "technical-analysis"
@@ -477,7 +545,11 @@ class DomainSpecificFlowiseManager(FlowiseManager):
     def get_domain_specialized_flows(self) -> Dict[str, FlowConfig]:
         """Get flows that are most relevant to the current domain"""
         if not self.domain_context:
-            return self.flows
+            return dict(self.flows)
+        
+        # Domain keywords and description are the same for every flow, so prepare them once
+        specialized_keywords = frozenset(self.domain_context.specialized_keywords or ())
+        description_lower = self.domain_context.description.lower()
         
         # Score flows based on domain relevance
         scored_flows = {}
@@ -485,22 +557,21 @@ class DomainSpecificFlowiseManager(FlowiseManager):
             relevance_score = 0
             
             # Check keyword overlap with domain
-            if self.domain_context.specialized_keywords:
-                keyword_overlap = set(config.intent_keywords) & set(self.domain_context.specialized_keywords)
-                relevance_score += len(keyword_overlap)
+            if specialized_keywords:
+                relevance_score += len(specialized_keywords.intersection(config.intent_keywords))
             
             # Add manual relevance scoring based on domain type
-            if "technical" in self.domain_context.description.lower() and name == "technical-analysis":
+            if "technical" in description_lower and name == "technical-analysis":
                 relevance_score += 3
-            elif "creative" in self.domain_context.description.lower() and name == "creative-orientation":
+            elif "creative" in description_lower and name == "creative-orientation":
                 relevance_score += 3
-            elif "cultural" in self.domain_context.description.lower() and name == "faith2story":
+            elif "cultural" in description_lower and name == "faith2story":
                 relevance_score += 3
             
             if relevance_score > 0:
                 scored_flows[name] = config
         
-        return scored_flows if scored_flows else self.flows
+        return scored_flows if scored_flows else dict(self.flows)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -200,19 +200,18 @@ class IntelligentFlowiseMCPServer:
         """Classify intent using available flows"""
         question_lower = question.lower()
         
-        # Score flows based on keyword matches
-        scores = {}
+        # Score flows based on keyword matches, keeping the first highest scorer
+        best_flow, best_score = None, 0
         for flow_key, flow_data in self.curated_flows.items():
             score = sum(1 for keyword in flow_data['intent_keywords'] 
                        if keyword in question_lower)
-            scores[flow_key] = score
+            if score > best_score:
+                best_flow, best_score = flow_key, score
         
         # Return best match or first available flow
-        if scores:
-            best_flow = max(scores.items(), key=lambda x: x[1])
-            return best_flow[0] if best_flow[1] > 0 else list(self.curated_flows.keys())[0]
-        
-        return list(self.curated_flows.keys())[0] if self.curated_flows else "creative-orientation"
+        if best_flow is not None:
+            return best_flow
+        return next(iter(self.curated_flows), "creative-orientation")
     
     def list_available_flows(self) -> Dict[str, Any]:
         """List flows available to users"""
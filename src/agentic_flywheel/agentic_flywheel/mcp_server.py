@@ -263,16 +263,16 @@ class FlowiseMCPServer:
         """Classify user intent based on question content"""
         question_lower = question.lower()
         
-        # Score each flow based on keyword matches
-        scores = {}
+        # Score each flow based on keyword matches, keeping the first highest scorer
+        best_flow, best_score = None, 0
         for flow_key, flow_config in self.flows.items():
             score = sum(1 for keyword in flow_config["intent_keywords"] 
                        if keyword in question_lower)
-            scores[flow_key] = score
+            if score > best_score:
+                best_flow, best_score = flow_key, score
         
         # Return the flow with highest score, default to creative-orientation
-        best_flow = max(scores.items(), key=lambda x: x[1])
-        return best_flow[0] if best_flow[1] > 0 else "creative-orientation"
+        return best_flow if best_flow is not None else "creative-orientation"
     
     async def _get_active_sessions(self) -> Dict[str, Any]:
         """Get currently tracked sessions"""
@@ -5,6 +5,7 @@ Integrates existing flowise_admin intelligence with universal backend interface
 """
 
 import asyncio
+import functools
 import logging
 import sys
 from pathlib import Path
@@ -87,7 +88,7 @@ class FlowiseBackend(FlowBackend):
         try:
             # Test connection through flowise manager
             if self.flowise_manager:
-                connection_test = self.flowise_manager.test_connection()
+                connection_test = await self._test_manager_connection()
                 if connection_test:
                     self._is_connected = True
                     logger.info("🔗 Connected to Flowise backend")
@@ -95,7 +96,7 @@ class FlowiseBackend(FlowBackend):
             
             # Fallback: test database connection
             if self.db_interface:
-                dashboard = self.db_interface.get_admin_dashboard_data()
+                dashboard = await self.db_interface.aget_admin_dashboard_data()
                 if dashboard:
                     self._is_connected = True
                     logger.info("🔗 Connected to Flowise via database")
@@ -108,6 +109,11 @@ class FlowiseBackend(FlowBackend):
             logger.error(f"❌ Flowise connection error: {e}")
             return False
     
+    async def _test_manager_connection(self) -> bool:
+        """Run the blocking FlowiseManager connection test without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.flowise_manager.test_connection)
+    
     async def disconnect(self) -> None:
         """Close connection to Flowise backend"""
         self._is_connected = False
@@ -121,11 +127,11 @@ class FlowiseBackend(FlowBackend):
         try:
             # Test through flowise manager if available
             if self.flowise_manager:
-                return self.flowise_manager.test_connection()
+                return await self._test_manager_connection()
             
             # Test database interface
             if self.db_interface:
-                dashboard = self.db_interface.get_admin_dashboard_data()
+                dashboard = await self.db_interface.aget_admin_dashboard_data()
                 return dashboard is not None
             
             return False
@@ -228,6 +234,7 @@ class FlowiseBackend(FlowBackend):
         
         try:
             # Get Flowise flow ID
+            flow_key = None
             flowise_flow_id = self._flow_id_mapping.get(flow_id)
             if not flowise_flow_id:
                 # Try to extract from universal ID
@@ -243,12 +250,14 @@ class FlowiseBackend(FlowBackend):
             if session_id:
                 flowise_session_id = self._session_mapping.get(session_id, session_id)
             
-            # Execute using flowise manager
-            result = self.flowise_manager.adaptive_query(
+            # Execute using flowise manager (a blocking HTTP call, so keep it off the event loop)
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(None, functools.partial(
+                self.flowise_manager.adaptive_query,
                 question=str(input_data),
-                intent=flow_key if 'flow_key' in locals() else None,
+                intent=flow_key,
                 session_id=flowise_session_id
-            )
+            ))
             
             # Add universal metadata
             if isinstance(result, dict):
@@ -401,7 +410,7 @@ class FlowiseBackend(FlowBackend):
             return {}
         
         try:
-            dashboard = self.db_interface.get_admin_dashboard_data()
+            dashboard = await self.db_interface.aget_admin_dashboard_data()
             return {
                 'total_messages': dashboard['system_health']['total_messages'],
                 'total_flows': dashboard['system_health']['total_flows'],
@@ -7,7 +7,8 @@ Manages discovery, registration, and lifecycle of flow execution backends
 import asyncio
 import importlib
 import logging
-from typing import Any, Dict, List, Optional, Type, Set
+import time
+from typing import Any, Dict, List, Optional, Type, Set, Tuple
 from pathlib import Path
 import json
 from dataclasses import asdict
@@ -17,17 +18,29 @@ from .base import FlowBackend, BackendType, UniversalFlow, UniversalPerformanceM
 
 logger = logging.getLogger(__name__)
 
+# Task capabilities mapped to the backend best suited for them, checked in order
+_CAPABILITY_PREFERENCES = (
+    (frozenset({'rag', 'retrieval'}), BackendType.LANGFLOW),  # Langflow is optimized for RAG
+    (frozenset({'chat', 'conversation'}), BackendType.FLOWISE),  # Flowise is optimized for chat
+)
+
 
 class BackendRegistry:
     """Central registry for managing flow execution backends"""
     
+    # Seconds a backend's discovered flow list is reused before asking the backend again
+    FLOWS_CACHE_TTL = 30.0
+    
     def __init__(self, config_path: Optional[str] = None):
         self.backends: Dict[BackendType, FlowBackend] = {}
         self.backend_classes: Dict[BackendType, Type[FlowBackend]] = {}
         self.config_path = config_path or "backend_registry.json"
         self._flows_cache: Dict[str, UniversalFlow] = {}
+        # backend -> (monotonic discovery time, flows) from the last successful discovery
+        self._discovered_flows: Dict[BackendType, Tuple[float, List[UniversalFlow]]] = {}
         self._performance_cache: Dict[str, UniversalPerformanceMetrics] = {}
         self._health_status: Dict[BackendType, bool] = {}
+        self._health_monitor: Optional[asyncio.Task] = None
     
     async def discover_backends(self) -> None:
         """Auto-discover available backend implementations"""
@@ -115,16 +128,14 @@ class BackendRegistry:
     
     async def connect_all_backends(self, configs: Optional[Dict[BackendType, Dict[str, Any]]] = None) -> Dict[BackendType, bool]:
         """Connect to all registered backends"""
-        results = {}
-        tasks = []
+        backend_types = list(self.backends.keys())
         
-        for backend_type in self.backends.keys():
-            config = configs.get(backend_type) if configs else None
-            task = self.connect_backend(backend_type, config)
-            tasks.append((backend_type, task))
-        
-        for backend_type, task in tasks:
-            results[backend_type] = await task
+        # Connect concurrently; connect_backend handles its own errors
+        connected = await asyncio.gather(*(
+            self.connect_backend(backend_type, configs.get(backend_type) if configs else None)
+            for backend_type in backend_types
+        ))
+        results = dict(zip(backend_types, connected))
         
         connected_count = sum(results.values())
         logger.info(f"🌐 Connected to {connected_count}/{len(results)} backends")
@@ -140,35 +151,67 @@ class BackendRegistry:
         try:
             await backend.disconnect()
             self._health_status[backend_type] = False
+            self._discovered_flows.pop(backend_type, None)
             logger.info(f"🔌 Disconnected from {backend_type.value} backend")
         except Exception as e:
             logger.error(f"❌ Disconnect error for {backend_type.value}: {e}")
     
     async def disconnect_all_backends(self) -> None:
         """Disconnect from all backends"""
+        await self.stop_health_monitor()
         tasks = [self.disconnect_backend(backend_type) for backend_type in self.backends.keys()]
         await asyncio.gather(*tasks, return_exceptions=True)
         logger.info("🔌 Disconnected from all backends")
     
     async def health_check_all(self) -> Dict[BackendType, bool]:
-        """Perform health checks on all backends"""
-        results = {}
-        
-        for backend_type, backend in self.backends.items():
-            try:
-                is_healthy = await backend.health_check()
-                results[backend_type] = is_healthy
-                self._health_status[backend_type] = is_healthy
-            except Exception as e:
-                logger.error(f"❌ Health check failed for {backend_type.value}: {e}")
-                results[backend_type] = False
-                self._health_status[backend_type] = False
+        """Perform health checks on all backends concurrently"""
+        backend_types = list(self.backends.keys())
+        health = await asyncio.gather(*(
+            self._check_backend_health(backend_type, self.backends[backend_type])
+            for backend_type in backend_types
+        ))
+        results = dict(zip(backend_types, health))
         
         healthy_count = sum(results.values())
         logger.info(f"💓 {healthy_count}/{len(results)} backends healthy")
         
         return results
     
+    def start_health_monitor(self, interval: float = 30.0) -> None:
+        """Refresh backend health in the background every ``interval`` seconds
+        
+        Routing reads the cached health status, so keeping it fresh off the request
+        path avoids health-check round trips per query. Requires a running event loop.
+        """
+        if self._health_monitor is None or self._health_monitor.done():
+            self._health_monitor = asyncio.ensure_future(self._health_monitor_loop(interval))
+    
+    async def stop_health_monitor(self) -> None:
+        """Stop the background health monitor, if running"""
+        monitor, self._health_monitor = self._health_monitor, None
+        if monitor is not None and not monitor.done():
+            monitor.cancel()
+            try:
+                await monitor
+            except asyncio.CancelledError:
+                pass
+    
+    async def _health_monitor_loop(self, interval: float) -> None:
+        """Periodically health-check all backends"""
+        while True:
+            await asyncio.sleep(interval)
+            await self.health_check_all()
+    
+    async def _check_backend_health(self, backend_type: BackendType, backend: FlowBackend) -> bool:
+        """Health-check one backend and record the result"""
+        try:
+            is_healthy = await backend.health_check()
+        except Exception as e:
+            logger.error(f"❌ Health check failed for {backend_type.value}: {e}")
+            is_healthy = False
+        self._health_status[backend_type] = is_healthy
+        return is_healthy
+    
     async def _update_health_status(self, backend_type: BackendType) -> None:
         """Update health status for a specific backend"""
         if backend_type in self.backends:
@@ -180,28 +223,41 @@ class BackendRegistry:
                 self._health_status[backend_type] = False
     
     # Flow Management Across Backends
-    async def discover_all_flows(self) -> Dict[BackendType, List[UniversalFlow]]:
-        """Discover flows from all connected backends"""
-        flows_by_backend = {}
+    async def discover_all_flows(self, refresh: bool = False) -> Dict[BackendType, List[UniversalFlow]]:
+        """Discover flows from all connected backends concurrently
         
-        for backend_type, backend in self.backends.items():
-            if not backend.is_connected:
-                continue
-            
-            try:
-                flows = await backend.discover_flows()
-                flows_by_backend[backend_type] = flows
-                
-                # Update cache
-                for flow in flows:
-                    self._flows_cache[flow.id] = flow
-                
-                logger.info(f"🔍 Discovered {len(flows)} flows from {backend_type.value}")
-            except Exception as e:
-                logger.error(f"❌ Flow discovery failed for {backend_type.value}: {e}")
-                flows_by_backend[backend_type] = []
+        Flow lists younger than FLOWS_CACHE_TTL are reused unless ``refresh`` is set.
+        """
+        backend_types = [
+            backend_type for backend_type, backend in self.backends.items()
+            if backend.is_connected
+        ]
+        discovered = await asyncio.gather(*(
+            self._discover_backend_flows(backend_type, self.backends[backend_type], refresh)
+            for backend_type in backend_types
+        ))
+        return dict(zip(backend_types, discovered))
+    
+    async def _discover_backend_flows(self, backend_type: BackendType, backend: FlowBackend,
+                                      refresh: bool = False) -> List[UniversalFlow]:
+        """Discover flows from one backend and add them to the flow cache"""
+        cached = self._discovered_flows.get(backend_type)
+        if cached and not refresh and time.monotonic() - cached[0] < self.FLOWS_CACHE_TTL:
+            return list(cached[1])
+        
+        try:
+            flows = await backend.discover_flows()
+        except Exception as e:
+            logger.error(f"❌ Flow discovery failed for {backend_type.value}: {e}")
+            return []
         
-        return flows_by_backend
+        # Update cache
+        self._discovered_flows[backend_type] = (time.monotonic(), list(flows))
+        for flow in flows:
+            self._flows_cache[flow.id] = flow
+        
+        logger.info(f"🔍 Discovered {len(flows)} flows from {backend_type.value}")
+        return flows
     
     async def get_all_flows(self) -> List[UniversalFlow]:
         """Get all flows from all backends"""
@@ -247,15 +303,10 @@ class BackendRegistry:
                 return preferred_backend
         
         # Heuristic selection based on capabilities
-        if 'rag' in capabilities or 'retrieval' in capabilities:
-            # Langflow is optimized for RAG
-            if BackendType.LANGFLOW in self.backends and self._health_status.get(BackendType.LANGFLOW, False):
-                return BackendType.LANGFLOW
-        
-        if 'chat' in capabilities or 'conversation' in capabilities:
-            # Flowise is optimized for chat
-            if BackendType.FLOWISE in self.backends and self._health_status.get(BackendType.FLOWISE, False):
-                return BackendType.FLOWISE
+        for preferred_capabilities, backend_type in _CAPABILITY_PREFERENCES:
+            if not preferred_capabilities.isdisjoint(capabilities):
+                if backend_type in self.backends and self._health_status.get(backend_type, False):
+                    return backend_type
         
         # Default to any healthy backend
         for backend_type, is_healthy in self._health_status.items():
@@ -301,12 +352,7 @@ class BackendRegistry:
         """Refresh flow cache for a specific backend"""
         backend = self.backends.get(backend_type)
         if backend and backend.is_connected:
-            try:
-                flows = await backend.discover_flows()
-                for flow in flows:
-                    self._flows_cache[flow.id] = flow
-            except Exception as e:
-                logger.error(f"❌ Cache refresh failed for {backend_type.value}: {e}")
+            await self._discover_backend_flows(backend_type, backend, refresh=True)
     
     # Configuration Management
     def save_config(self) -> None:
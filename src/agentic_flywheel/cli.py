@@ -151,8 +151,10 @@ def flowise(test_connection, query, max_messages):
     """Test integration with user's Flowise server at beagle-emerging-gnu.ngrok-free.app."""
     
     async def run_flowise_test():
-        helper = FlowiseIntegrationHelper()
-        
+        async with FlowiseIntegrationHelper() as helper:
+            await run_with_helper(helper)
+    
+    async def run_with_helper(helper):
         if test_connection:
             click.echo("🔗 Testing connection to beagle-emerging-gnu.ngrok-free.app...")
             result = await helper.test_connection()
@@ -7,8 +7,12 @@ Provides intelligent access to local flowise SQLite databases with full admin ca
 import sqlite3
 import json
 import logging
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+import asyncio
+import heapq
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Iterator
+from dataclasses import dataclass, fields
 from datetime import datetime, timedelta
 import uuid
 from pathlib import Path
@@ -25,7 +29,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ChatMessage:
     """Represents a chat message from flowise database"""
     id: str
@@ -40,8 +47,9 @@ class ChatMessage:
     memory_type: Optional[str] = None
     agent_reasoning: Optional[str] = None
     artifacts: Optional[str] = None
+    flow_name: Optional[str] = None
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class FlowStats:
     """Statistics about a specific chatflow"""
     chatflow_id: str
@@ -55,7 +63,7 @@ class FlowStats:
     success_score: float = 0.0
     engagement_score: float = 0.0
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ConversationPattern:
     """Represents a conversation pattern extracted from chat data"""
     pattern_type: str
@@ -67,9 +75,39 @@ class ConversationPattern:
     context_keywords: List[str]
     usage_frequency: int = 0
 
+# Field names resolved once so dashboard serialization skips asdict()'s recursive reflection
+_FLOW_STATS_FIELDS = tuple(f.name for f in fields(FlowStats))
+_CONVERSATION_PATTERN_FIELDS = tuple(f.name for f in fields(ConversationPattern))
+
+def _flow_stats_to_dict(stat: FlowStats) -> Dict[str, Any]:
+    """Shallow dict view of a FlowStats record"""
+    return {name: getattr(stat, name) for name in _FLOW_STATS_FIELDS}
+
+def _conversation_pattern_to_dict(pattern: ConversationPattern) -> Dict[str, Any]:
+    """Shallow dict view of a ConversationPattern record"""
+    return {name: getattr(pattern, name) for name in _CONVERSATION_PATTERN_FIELDS}
+
 class FlowiseDBInterface:
     """Admin-level interface for accessing flowise SQLite databases with full capabilities"""
     
+    __slots__ = ('database_path', 'flow_manager', 'flow_id_mapping', '_flow_name_case', '_flow_name_params',
+                 '_local', '_connections', '_connections_lock', '_executor')
+    
+    # Worker threads for concurrent read queries (each keeps its own connection)
+    _QUERY_WORKERS = 4
+    
+    # Per-connection prepared statement cache (sqlite3 default is 128)
+    _STATEMENT_CACHE_SIZE = 256
+    
+    # Applied once per connection in a single executescript round-trip. Only
+    # connection-scoped settings: persistent ones such as journal_mode belong to Flowise.
+    # mmap_size maps the DB file so full-scan analytics read straight from the page cache.
+    _CONNECTION_PRAGMAS = """
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-64000;
+        PRAGMA mmap_size=268435456;
+    """
+    
     def __init__(self, database_path: str = "/home/jgi/.flowise/database.sqlite"):
         self.database_path = Path(database_path)
         
@@ -98,36 +136,208 @@ class FlowiseDBInterface:
         
         if not self.database_path.exists():
             raise FileNotFoundError(f"Database not found: {database_path}")
+        
+        # One long-lived connection per thread keeps sqlite3's statement cache warm
+        self._local = threading.local()
+        self._connections: List[Tuple[threading.Thread, sqlite3.Connection]] = []
+        self._connections_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Resolve flow names inside SQL so message rows arrive already labelled
+        self._flow_name_case, self._flow_name_params = self._build_flow_name_case()
             
         logger.info(f"✅ FlowiseDBInterface initialized with database: {database_path}")
     
-    def _execute_query(self, query: str, params: Tuple = ()) -> List[Dict[str, Any]]:
-        """Execute a query and return results as list of dictionaries"""
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return this thread's persistent connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Each connection is only used by the thread that opened it;
+            # check_same_thread=False just lets close() run from any thread
+            conn = sqlite3.connect(
+                self.database_path,
+                cached_statements=self._STATEMENT_CACHE_SIZE,
+                check_same_thread=False,
+                # Autocommit: reads never leave an implicit transaction open between calls
+                isolation_level=None
+            )
+            conn.row_factory = sqlite3.Row
+            try:
+                conn.executescript(self._CONNECTION_PRAGMAS)
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ Could not apply connection pragmas: {e}")
+            self._local.conn = conn
+            with self._connections_lock:
+                # Drop connections whose owning thread has exited
+                live = []
+                for owner, owned_conn in self._connections:
+                    if owner.is_alive():
+                        live.append((owner, owned_conn))
+                    else:
+                        owned_conn.close()
+                live.append((threading.current_thread(), conn))
+                self._connections = live
+        return conn
+    
+    def submit(self, func, *args, **kwargs) -> Future:
+        """Run a blocking database call on the interface's query worker pool"""
+        with self._connections_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._QUERY_WORKERS, thread_name_prefix="flowise-db"
+                )
+            executor = self._executor
+        return executor.submit(func, *args, **kwargs)
+    
+    def data_fingerprint(self) -> Tuple[int, ...]:
+        """Cheap change token for the database: (mtime_ns, size) of the DB file and its WAL
+        
+        An empty WAL counts as absent: SQLite resets it whenever a connection opens,
+        so its mtime changes without the data changing.
+        """
+        fingerprint: List[int] = []
+        for path in (self.database_path, self.database_path.with_name(self.database_path.name + "-wal")):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                fingerprint.extend((0, 0))
+                continue
+            fingerprint.extend((stat.st_mtime_ns, stat.st_size) if stat.st_size else (0, 0))
+        return tuple(fingerprint)
+    
+    def close(self) -> None:
+        """Close all database connections opened by this interface"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for _, conn in connections:
+            conn.close()
+        self._local = threading.local()
+    
+    def __enter__(self) -> "FlowiseDBInterface":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def ensure_admin_indexes(self) -> bool:
+        """Create the indexes used by the analytics scans (opt-in: this writes to Flowise's database)
+        
+        The indexes are not part of Flowise's own migrations, so they are only created when
+        explicitly requested (``--create-indexes`` on the CLI). Returns False if the database
+        could not be written.
+        """
         try:
-            with sqlite3.connect(self.database_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                return [dict(row) for row in cursor.fetchall()]
+            with self._get_connection() as conn:
+                # Expression index: length(content) is stored in the index, so the
+                # pattern-mining filter no longer recomputes it for every row
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS ix_cm_flow_role_len "
+                    "ON chat_message(chatflowid, role, length(content))"
+                )
+                # Covering index for the analyzer's per-flow session and hourly scans:
+                # those queries read only these columns, never the wide content rows
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS ix_cm_flow_session_created "
+                    "ON chat_message(chatflowid, sessionId, createdDate)"
+                )
+                # Date-range filters and recency ordering
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS ix_cm_created_date "
+                    "ON chat_message(createdDate)"
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Could not create admin indexes: {e}")
+            return False
+        return True
+    
+    @staticmethod
+    def _build_search_pattern(search_term: str) -> str:
+        """Translate a search term into a LIKE pattern (escape character: backslash)
+        
+        Plain terms match anywhere in the content. Terms containing ``*`` are
+        treated as wildcards, so ``plan*`` is an anchored prefix search.
+        Literal ``%`` and ``_`` are always escaped.
+        """
+        escaped = search_term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        if '*' in escaped:
+            return escaped.replace('*', '%')
+        return f"%{escaped}%"
+    
+    def _build_flow_name_case(self) -> Tuple[str, Tuple[str, ...]]:
+        """Build a parameterized CASE expression mapping chatflowid to its flow name"""
+        if not self.flow_id_mapping:
+            return "'unknown'", ()
+        
+        whens = " ".join("WHEN ? THEN ?" for _ in self.flow_id_mapping)
+        params = tuple(value for item in self.flow_id_mapping.items() for value in item)
+        return f"CASE chatflowid {whens} ELSE 'unknown' END", params
+    
+    def _execute_query(self, query: str, params: Tuple = ()) -> List[sqlite3.Row]:
+        """Execute a query and return results as sqlite3.Row objects (support row['column'] access)"""
+        try:
+            return self._get_connection().execute(query, params).fetchall()
         except Exception as e:
             logger.error(f"Database query error: {e}")
             return []
     
+    def _iter_query(self, query: str, params: Tuple = (), batch_size: int = 256) -> Iterator[sqlite3.Row]:
+        """Execute a query and lazily yield sqlite3.Row objects, fetching in batches"""
+        try:
+            cursor = self._get_connection().execute(query, params)
+            cursor.arraysize = batch_size
+            while True:
+                batch = cursor.fetchmany()
+                if not batch:
+                    break
+                yield from batch
+        except sqlite3.Error as e:
+            logger.error(f"Database query error: {e}")
+    
+    # Selected in ChatMessage field order so rows can be unpacked positionally
+    _CHAT_MESSAGE_COLUMNS = """
+            id, role, chatflowid, content, createdDate, sessionId,
+            sourceDocuments, usedTools, chatId, memoryType, 
+            agentReasoning, artifacts"""
+    
+    @staticmethod
+    def _row_to_chat_message(row: sqlite3.Row) -> ChatMessage:
+        """Build a ChatMessage from a row selecting _CHAT_MESSAGE_COLUMNS plus flow_name"""
+        return ChatMessage(
+            row[0], row[1], row[2], row[3],
+            datetime.fromisoformat(row[4].replace('Z', '+00:00')),
+            *row[5:]
+        )
+    
     def get_flow_statistics(self) -> List[FlowStats]:
         """Get comprehensive statistics for all chatflows with enhanced analytics"""
+        # Success score (user engagement, content length, session diversity) is computed
+        # in the same statement so every flow is scored in one pass inside SQLite
         query = """
         SELECT 
-            chatflowid,
-            COUNT(*) as message_count,
-            COUNT(DISTINCT sessionId) as session_count,
-            MIN(createdDate) as first_message,
-            MAX(createdDate) as last_message,
-            AVG(length(content)) as avg_content_length,
-            COUNT(CASE WHEN role = 'userMessage' THEN 1 END) as user_messages,
-            COUNT(CASE WHEN role = 'apiMessage' THEN 1 END) as api_messages
-        FROM chat_message 
-        WHERE sessionId IS NOT NULL
-        GROUP BY chatflowid
+            *,
+            COALESCE(MIN(
+                user_messages * 1.0 / MAX(message_count, 1) * 0.4 +
+                MIN(avg_content_length / 200.0, 1.0) * 0.3 +
+                MIN(session_count * 1.0 / MAX(message_count, 1) * 10, 1.0) * 0.3,
+                1.0
+            ), 0.0) as success_score
+        FROM (
+            SELECT 
+                chatflowid,
+                COUNT(*) as message_count,
+                COUNT(DISTINCT sessionId) as session_count,
+                MIN(createdDate) as first_message,
+                MAX(createdDate) as last_message,
+                AVG(length(content)) as avg_content_length,
+                COUNT(CASE WHEN role = 'userMessage' THEN 1 END) as user_messages,
+                COUNT(CASE WHEN role = 'apiMessage' THEN 1 END) as api_messages
+            FROM chat_message 
+            WHERE sessionId IS NOT NULL
+            GROUP BY chatflowid
+        )
         ORDER BY message_count DESC
         """
         
@@ -141,9 +351,6 @@ class FlowiseDBInterface:
             # Get most active session for this flow
             most_active_session = self._get_most_active_session(row['chatflowid'])
             
-            # Calculate success score (based on user engagement)
-            success_score = self._calculate_success_score(row)
-            
             # Calculate engagement score (multi-turn conversations)
             engagement_score = self._calculate_engagement_score(row['chatflowid'])
             
@@ -159,31 +366,12 @@ class FlowiseDBInterface:
                 last_message=datetime.fromisoformat(row['last_message'].replace('Z', '+00:00')),
                 avg_messages_per_session=avg_msgs,
                 most_active_session=most_active_session,
-                success_score=success_score,
+                success_score=row['success_score'],
                 engagement_score=engagement_score
             ))
         
         return stats
     
-    def _calculate_success_score(self, row: Dict[str, Any]) -> float:
-        """Calculate success score based on conversation quality indicators"""
-        try:
-            # Base metrics
-            user_msg_ratio = row['user_messages'] / max(row['message_count'], 1)
-            avg_content_length = row.get('avg_content_length', 0)
-            session_diversity = row['session_count'] / max(row['message_count'], 1)
-            
-            # Weighted scoring
-            score = (
-                user_msg_ratio * 0.4 +  # Higher user engagement = better
-                min(avg_content_length / 200, 1.0) * 0.3 +  # Reasonable response length
-                min(session_diversity * 10, 1.0) * 0.3  # Multiple sessions indicate utility
-            )
-            
-            return min(score, 1.0)
-        except:
-            return 0.0
-    
     def _calculate_engagement_score(self, chatflow_id: str) -> float:
         """Calculate engagement score based on multi-turn conversations"""
         query = """
@@ -220,17 +408,14 @@ class FlowiseDBInterface:
     def get_recent_conversations(self, limit: int = 10, flow_id: Optional[str] = None) -> List[ChatMessage]:
         """Get recent conversation messages with optional flow filtering"""
         where_clause = "WHERE 1=1"
-        params = []
+        params = list(self._flow_name_params)
         
         if flow_id:
             where_clause += " AND chatflowid = ?"
             params.append(flow_id)
         
         query = f"""
-        SELECT 
-            id, role, chatflowid, content, createdDate, sessionId,
-            sourceDocuments, usedTools, chatId, memoryType, 
-            agentReasoning, artifacts
+        SELECT {self._CHAT_MESSAGE_COLUMNS}, {self._flow_name_case} AS flow_name
         FROM chat_message 
         {where_clause}
         ORDER BY createdDate DESC 
@@ -238,34 +423,19 @@ class FlowiseDBInterface:
         """
         params.append(limit)
         
-        results = self._execute_query(query, tuple(params))
-        messages = []
-        
-        for row in results:
-            messages.append(ChatMessage(
-                id=row['id'],
-                role=row['role'],
-                chatflowid=row['chatflowid'],
-                content=row['content'],
-                created_date=datetime.fromisoformat(row['createdDate'].replace('Z', '+00:00')),
-                session_id=row.get('sessionId'),
-                source_documents=row.get('sourceDocuments'),
-                used_tools=row.get('usedTools'),
-                chat_id=row.get('chatId'),
-                memory_type=row.get('memoryType'),
-                agent_reasoning=row.get('agentReasoning'),
-                artifacts=row.get('artifacts')
-            ))
-        
-        return messages
+        return [self._row_to_chat_message(row) for row in self._iter_query(query, tuple(params))]
     
-    def extract_conversation_patterns(self, flow_id: Optional[str] = None) -> List[ConversationPattern]:
-        """Extract patterns from successful conversations for flow enhancement"""
+    def extract_conversation_patterns(self, flow_id: Optional[str] = None,
+                                      flow_stats: Optional[List[FlowStats]] = None) -> List[ConversationPattern]:
+        """Extract patterns from successful conversations for flow enhancement
+        
+        Pass already-computed ``flow_stats`` to avoid re-running the statistics scan.
+        """
         patterns = []
         
         # Get flow statistics for context
-        flow_stats = self.get_flow_statistics()
-        stats_by_id = {stat.chatflow_id: stat for stat in flow_stats}
+        if flow_stats is None:
+            flow_stats = self.get_flow_statistics()
         
         # Focus on high-performing flows
         high_performing_flows = [
@@ -285,136 +455,132 @@ class FlowiseDBInterface:
         """Extract patterns for a specific high-performing flow"""
         patterns = []
         
-        # Get successful conversations for this flow
-        query = """
-        SELECT content, role, sessionId, createdDate
+        # Only flows with a dedicated extractor pay for the keyword aggregate queries
+        extractor = self._FLOW_EXTRACTORS.get(flow_stat.flow_name)
+        if extractor:
+            patterns.extend(extractor(self, flow_stat))
+        
+        # Always extract general engagement patterns
+        patterns.extend(self._extract_engagement_patterns(flow_stat))
+        
+        return patterns
+    
+    # Recent substantive user messages for a flow - the window keyword patterns are mined from
+    _RECENT_USER_CONTENT = """
+        SELECT content, createdDate
         FROM chat_message 
         WHERE chatflowid = ?
         AND role = 'userMessage'
         AND length(content) > 20
         ORDER BY createdDate DESC
         LIMIT 100
-        """
-        
-        results = self._execute_query(query, (flow_stat.chatflow_id,))
-        
-        if flow_stat.flow_name == "creative-orientation":
-            patterns.extend(self._extract_creative_orientation_patterns(results, flow_stat))
-        elif flow_stat.flow_name == "faith2story":
-            patterns.extend(self._extract_faith_story_patterns(results, flow_stat))
-        elif flow_stat.flow_name == "miadi46code":
-            patterns.extend(self._extract_coding_patterns(results, flow_stat))
-        
-        # Always extract general engagement patterns
-        patterns.extend(self._extract_engagement_patterns(flow_stat))
-        
-        return patterns
+    """
     
-    def _extract_creative_orientation_patterns(self, messages: List[Dict], flow_stat: FlowStats) -> List[ConversationPattern]:
-        """Extract patterns from creative orientation conversations"""
-        vision_keywords = []
-        outcome_keywords = []
-        structural_keywords = []
+    @staticmethod
+    def _keyword_match_clause(keywords: List[str]) -> Tuple[str, List[str]]:
+        """Build a case-insensitive 'content contains any keyword' SQL predicate"""
+        clause = "(" + " OR ".join("content LIKE ?" for _ in keywords) + ")"
+        return clause, [f"%{keyword}%" for keyword in keywords]
+    
+    def _extract_keyword_patterns(self, flow_stat: FlowStats,
+                                  pattern_specs: List[Dict[str, Any]]) -> List[ConversationPattern]:
+        """Count keyword matches in SQL (one aggregate row) and build patterns from the counts"""
+        select_terms = []
+        params: List[Any] = []
+        for i, spec in enumerate(pattern_specs):
+            clause, clause_params = self._keyword_match_clause(spec['match_keywords'])
+            select_terms.append(f"COALESCE(SUM({clause}), 0) AS match_count_{i}")
+            params.extend(clause_params)
+        
+        query = f"SELECT {', '.join(select_terms)} FROM ({self._RECENT_USER_CONTENT})"
+        params.append(flow_stat.chatflow_id)
         
-        for row in messages:
-            content_lower = row['content'].lower()
-            
-            if any(word in content_lower for word in ['vision', 'want to create', 'goal', 'dream', 'aspire']):
-                vision_keywords.append(row['content'][:100])
-            
-            if any(word in content_lower for word in ['outcome', 'achieve', 'result', 'accomplish']):
-                outcome_keywords.append(row['content'][:100])
-            
-            if any(word in content_lower for word in ['tension', 'current reality', 'desired', 'advancement']):
-                structural_keywords.append(row['content'][:100])
+        results = self._execute_query(query, tuple(params))
+        if not results:
+            return []
+        counts = results[0]
         
         patterns = []
-        
-        if vision_keywords:
-            patterns.append(ConversationPattern(
-                pattern_type="vision_creation",
-                flow_id=flow_stat.chatflow_id,
-                flow_name=flow_stat.flow_name,
-                confidence=min(len(vision_keywords) / 20.0, 1.0),
-                examples=vision_keywords[:5],
-                success_indicators=["clear vision articulation", "outcome focus"],
-                context_keywords=["vision", "create", "goal", "dream", "aspire"],
-                usage_frequency=len(vision_keywords)
-            ))
-        
-        if outcome_keywords:
+        for i, spec in enumerate(pattern_specs):
+            match_count = counts[f"match_count_{i}"]
+            if not match_count:
+                continue
+            
             patterns.append(ConversationPattern(
-                pattern_type="outcome_focus",
+                pattern_type=spec['pattern_type'],
                 flow_id=flow_stat.chatflow_id,
                 flow_name=flow_stat.flow_name,
-                confidence=min(len(outcome_keywords) / 20.0, 1.0),
-                examples=outcome_keywords[:5],
-                success_indicators=["outcome clarity", "action orientation"],
-                context_keywords=["outcome", "achieve", "result", "accomplish"],
-                usage_frequency=len(outcome_keywords)
+                confidence=min(match_count / spec['saturation'], 1.0),
+                examples=self._get_keyword_examples(flow_stat.chatflow_id, spec['match_keywords']),
+                success_indicators=spec['success_indicators'],
+                context_keywords=spec['context_keywords'],
+                usage_frequency=match_count
             ))
         
         return patterns
     
-    def _extract_faith_story_patterns(self, messages: List[Dict], flow_stat: FlowStats) -> List[ConversationPattern]:
+    def _get_keyword_examples(self, chatflow_id: str, keywords: List[str], limit: int = 5) -> List[str]:
+        """Fetch the most recent matching messages (truncated) as pattern examples"""
+        clause, params = self._keyword_match_clause(keywords)
+        query = f"""
+        SELECT substr(content, 1, 100) AS example
+        FROM ({self._RECENT_USER_CONTENT})
+        WHERE {clause}
+        ORDER BY createdDate DESC
+        LIMIT ?
+        """
+        results = self._execute_query(query, (chatflow_id, *params, limit))
+        return [row['example'] for row in results]
+    
+    def _extract_creative_orientation_patterns(self, flow_stat: FlowStats) -> List[ConversationPattern]:
+        """Extract patterns from creative orientation conversations"""
+        return self._extract_keyword_patterns(flow_stat, [
+            {
+                'pattern_type': "vision_creation",
+                'match_keywords': ['vision', 'want to create', 'goal', 'dream', 'aspire'],
+                'saturation': 20.0,
+                'success_indicators': ["clear vision articulation", "outcome focus"],
+                'context_keywords': ["vision", "create", "goal", "dream", "aspire"],
+            },
+            {
+                'pattern_type': "outcome_focus",
+                'match_keywords': ['outcome', 'achieve', 'result', 'accomplish'],
+                'saturation': 20.0,
+                'success_indicators': ["outcome clarity", "action orientation"],
+                'context_keywords': ["outcome", "achieve", "result", "accomplish"],
+            },
+        ])
+    
+    def _extract_faith_story_patterns(self, flow_stat: FlowStats) -> List[ConversationPattern]:
         """Extract patterns from faith story conversations"""
-        narrative_patterns = []
-        experience_patterns = []
-        
-        for row in messages:
-            content_lower = row['content'].lower()
-            
-            if any(word in content_lower for word in ['story', 'experience', 'journey', 'path']):
-                narrative_patterns.append(row['content'][:100])
-            
-            if any(word in content_lower for word in ['faith', 'spiritual', 'grace', 'meaning', 'purpose']):
-                experience_patterns.append(row['content'][:100])
-        
-        patterns = []
-        
-        if narrative_patterns:
-            patterns.append(ConversationPattern(
-                pattern_type="narrative_transformation",
-                flow_id=flow_stat.chatflow_id,
-                flow_name=flow_stat.flow_name,
-                confidence=min(len(narrative_patterns) / 20.0, 1.0),
-                examples=narrative_patterns[:5],
-                success_indicators=["story structure", "personal connection"],
-                context_keywords=["story", "experience", "journey", "path"],
-                usage_frequency=len(narrative_patterns)
-            ))
-        
-        return patterns
+        return self._extract_keyword_patterns(flow_stat, [
+            {
+                'pattern_type': "narrative_transformation",
+                'match_keywords': ['story', 'experience', 'journey', 'path'],
+                'saturation': 20.0,
+                'success_indicators': ["story structure", "personal connection"],
+                'context_keywords': ["story", "experience", "journey", "path"],
+            },
+        ])
     
-    def _extract_coding_patterns(self, messages: List[Dict], flow_stat: FlowStats) -> List[ConversationPattern]:
+    def _extract_coding_patterns(self, flow_stat: FlowStats) -> List[ConversationPattern]:
         """Extract patterns from coding-related conversations"""
-        implementation_patterns = []
-        problem_solving_patterns = []
-        
-        for row in messages:
-            content_lower = row['content'].lower()
-            
-            if any(word in content_lower for word in ['implement', 'code', 'build', 'create', 'develop']):
-                implementation_patterns.append(row['content'][:100])
-            
-            if any(word in content_lower for word in ['debug', 'fix', 'error', 'issue', 'problem']):
-                problem_solving_patterns.append(row['content'][:100])
-        
-        patterns = []
-        
-        if implementation_patterns:
-            patterns.append(ConversationPattern(
-                pattern_type="code_implementation",
-                flow_id=flow_stat.chatflow_id,
-                flow_name=flow_stat.flow_name,
-                confidence=min(len(implementation_patterns) / 15.0, 1.0),
-                examples=implementation_patterns[:5],
-                success_indicators=["clear requirements", "implementation focus"],
-                context_keywords=["implement", "code", "build", "create", "develop"],
-                usage_frequency=len(implementation_patterns)
-            ))
-        
-        return patterns
+        return self._extract_keyword_patterns(flow_stat, [
+            {
+                'pattern_type': "code_implementation",
+                'match_keywords': ['implement', 'code', 'build', 'create', 'develop'],
+                'saturation': 15.0,
+                'success_indicators': ["clear requirements", "implementation focus"],
+                'context_keywords': ["implement", "code", "build", "create", "develop"],
+            },
+        ])
+    
+    # Flow name -> keyword pattern extractor (plain functions, called with self)
+    _FLOW_EXTRACTORS = {
+        "creative-orientation": _extract_creative_orientation_patterns,
+        "faith2story": _extract_faith_story_patterns,
+        "miadi46code": _extract_coding_patterns,
+    }
     
     def _extract_engagement_patterns(self, flow_stat: FlowStats) -> List[ConversationPattern]:
         """Extract engagement patterns for any flow"""
@@ -434,25 +600,46 @@ class FlowiseDBInterface:
         
         return patterns
     
-    def get_admin_dashboard_data(self) -> Dict[str, Any]:
-        """Get comprehensive dashboard data for admin interface"""
-        # Get basic statistics
-        flow_stats = self.get_flow_statistics()
-        patterns = self.extract_conversation_patterns()
-        
-        # Calculate overall system health
-        total_messages = sum(stat.message_count for stat in flow_stats)
-        avg_success_score = sum(stat.success_score for stat in flow_stats) / len(flow_stats) if flow_stats else 0
-        
-        # Recent activity analysis
-        recent_query = """
+    _RECENT_ACTIVITY_QUERY = """
         SELECT DATE(createdDate) as date, COUNT(*) as messages, COUNT(DISTINCT sessionId) as sessions
         FROM chat_message 
         WHERE createdDate >= date('now', '-7 days')
         GROUP BY DATE(createdDate)
         ORDER BY date DESC
+    """
+    
+    def _submit_dashboard_scans(self) -> Tuple[Future, Future]:
+        """Start the independent flow statistics and recent activity scans on the worker pool"""
+        return (
+            self.submit(self.get_flow_statistics),
+            self.submit(self._execute_query, self._RECENT_ACTIVITY_QUERY),
+        )
+    
+    def get_admin_dashboard_data(self) -> Dict[str, Any]:
+        """Get comprehensive dashboard data for admin interface, running independent queries concurrently
+        
+        Blocks on worker-pool futures rather than an event loop, so it is also safe to call from async code.
         """
-        recent_activity = self._execute_query(recent_query)
+        flow_stats_future, recent_activity_future = self._submit_dashboard_scans()
+        flow_stats = flow_stats_future.result()
+        # Pattern extraction reuses the statistics instead of recomputing them
+        patterns = self.extract_conversation_patterns(flow_stats=flow_stats)
+        return self._build_dashboard_data(flow_stats, recent_activity_future.result(), patterns)
+    
+    async def aget_admin_dashboard_data(self) -> Dict[str, Any]:
+        """Awaitable get_admin_dashboard_data that keeps every query off the event loop"""
+        flow_stats_future, recent_activity_future = self._submit_dashboard_scans()
+        flow_stats = await asyncio.wrap_future(flow_stats_future)
+        patterns = await asyncio.wrap_future(self.submit(self.extract_conversation_patterns, flow_stats=flow_stats))
+        recent_activity = await asyncio.wrap_future(recent_activity_future)
+        return self._build_dashboard_data(flow_stats, recent_activity, patterns)
+    
+    def _build_dashboard_data(self, flow_stats: List[FlowStats], recent_activity: List[sqlite3.Row],
+                              patterns: List[ConversationPattern]) -> Dict[str, Any]:
+        """Assemble the dashboard payload from already-fetched query results"""
+        # Calculate overall system health
+        total_messages = sum(stat.message_count for stat in flow_stats)
+        avg_success_score = sum(stat.success_score for stat in flow_stats) / len(flow_stats) if flow_stats else 0
         
         # Live integration status
         live_status = {
@@ -473,30 +660,27 @@ class FlowiseDBInterface:
                         'engagement_score': stat.engagement_score,
                         'message_count': stat.message_count
                     }
-                    for stat in sorted(flow_stats, key=lambda x: x.success_score, reverse=True)[:5]
+                    for stat in heapq.nlargest(5, flow_stats, key=lambda x: x.success_score)
                 ]
             },
-            'flow_statistics': [asdict(stat) for stat in flow_stats],
-            'conversation_patterns': [asdict(pattern) for pattern in patterns],
-            'recent_activity': recent_activity,
+            'flow_statistics': [_flow_stats_to_dict(stat) for stat in flow_stats],
+            'conversation_patterns': [_conversation_pattern_to_dict(pattern) for pattern in patterns],
+            'recent_activity': [dict(row) for row in recent_activity],
             'live_integration': live_status,
             'analysis_timestamp': datetime.now().isoformat()
         }
     
     def search_conversations(self, search_term: str, flow_id: Optional[str] = None, limit: int = 20) -> List[ChatMessage]:
-        """Search conversation content for specific terms"""
-        where_clause = "WHERE content LIKE ?"
-        params = [f"%{search_term}%"]
+        """Search conversation content for specific terms (``*`` acts as a wildcard, e.g. ``plan*``)"""
+        where_clause = "WHERE content LIKE ? ESCAPE '\\'"
+        params = [*self._flow_name_params, self._build_search_pattern(search_term)]
         
         if flow_id:
             where_clause += " AND chatflowid = ?"
             params.append(flow_id)
         
         query = f"""
-        SELECT 
-            id, role, chatflowid, content, createdDate, sessionId,
-            sourceDocuments, usedTools, chatId, memoryType, 
-            agentReasoning, artifacts
+        SELECT {self._CHAT_MESSAGE_COLUMNS}, {self._flow_name_case} AS flow_name
         FROM chat_message 
         {where_clause}
         ORDER BY createdDate DESC 
@@ -504,26 +688,7 @@ class FlowiseDBInterface:
         """
         params.append(limit)
         
-        results = self._execute_query(query, tuple(params))
-        messages = []
-        
-        for row in results:
-            messages.append(ChatMessage(
-                id=row['id'],
-                role=row['role'], 
-                chatflowid=row['chatflowid'],
-                content=row['content'],
-                created_date=datetime.fromisoformat(row['createdDate'].replace('Z', '+00:00')),
-                session_id=row.get('sessionId'),
-                source_documents=row.get('sourceDocuments'),
-                used_tools=row.get('usedTools'),
-                chat_id=row.get('chatId'),
-                memory_type=row.get('memoryType'),
-                agent_reasoning=row.get('agentReasoning'),
-                artifacts=row.get('artifacts')
-            ))
-        
-        return messages
+        return [self._row_to_chat_message(row) for row in self._iter_query(query, tuple(params))]
 
 def main():
     """CLI interface for admin database analysis"""
@@ -537,13 +702,22 @@ def main():
     parser.add_argument("--patterns", action="store_true", help="Extract conversation patterns")
     parser.add_argument("--search", help="Search conversations for term")
     parser.add_argument("--export", help="Export analysis to JSON file")
+    parser.add_argument("--create-indexes", action="store_true",
+                       help="Create the admin analytics indexes (writes to the flowise database)")
     
     args = parser.parse_args()
     
+    db = None
     try:
         db = FlowiseDBInterface(args.database)
         
-        if args.dashboard:
+        if args.create_indexes:
+            if db.ensure_admin_indexes():
+                print("✅ Admin indexes created")
+            else:
+                print("❌ Could not create admin indexes")
+        
+        elif args.dashboard:
             dashboard = db.get_admin_dashboard_data()
             if args.export:
                 with open(args.export, 'w') as f:
@@ -571,8 +745,7 @@ def main():
         elif args.search:
             messages = db.search_conversations(args.search)
             for msg in messages[:5]:
-                flow_name = db.flow_id_mapping.get(msg.chatflowid, 'unknown')
-                print(f"\n[{msg.created_date.strftime('%Y-%m-%d %H:%M')}] {flow_name}")
+                print(f"\n[{msg.created_date.strftime('%Y-%m-%d %H:%M')}] {msg.flow_name}")
                 print(f"   {msg.role}: {msg.content[:150]}...")
         
         else:
@@ -592,6 +765,9 @@ def main():
         print(f"❌ Error: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        if db is not None:
+            db.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,20 +6,43 @@ Analyzes conversation patterns and flow performance to optimize flowise automati
 
 import json
 import logging
+import os
+import hashlib
+from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
-import statistics
-from collections import defaultdict
+import math
+import operator
+import heapq
+from array import array
+from collections import Counter, defaultdict
 
+# Optional fast JSON serializer for CLI output
 try:
-    from .db_interface import FlowiseDBInterface, FlowStats, ConversationPattern
+    import orjson
 except ImportError:
-    from db_interface import FlowiseDBInterface, FlowStats, ConversationPattern
+    orjson = None
+
+try:
+    from .db_interface import FlowiseDBInterface, FlowStats, ConversationPattern, _DATACLASS_SLOTS
+except ImportError:
+    from db_interface import FlowiseDBInterface, FlowStats, ConversationPattern, _DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Keywords flagging confused users; compiled once into the SQL predicate that
+# classifies problematic messages inside SQLite (LIKE is ASCII case-insensitive)
+_CONFUSION_KEYWORDS = ('unclear', 'confused', 'wrong', 'error')
+_CONFUSION_MATCH_SQL = "(" + " OR ".join(f"content LIKE '%{word}%'" for word in _CONFUSION_KEYWORDS) + ")"
+
+# Weights of the (engagement, success, usage, quality, content) performance score components
+_PERFORMANCE_WEIGHTS = (0.25, 0.25, 0.20, 0.15, 0.15)
+
+# Bump when the analysis logic changes so cached global reports are recomputed
+_GLOBAL_REPORT_CACHE_VERSION = "v3"
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class FlowPerformanceReport:
     """Comprehensive performance report for a specific flow"""
     flow_id: str
@@ -53,21 +76,79 @@ class FlowPerformanceReport:
     content_gaps: List[str]
     technical_improvements: List[str]
 
+def _dumps_report(report: Dict[str, Any]) -> bytes:
+    """Serialize a report as indented UTF-8 JSON, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(report, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(report, indent=2, default=str, ensure_ascii=False).encode()
+
+def _median_of_sorted(values: List[float]) -> float:
+    """Median of an already sorted, non-empty list"""
+    mid = len(values) // 2
+    if len(values) % 2:
+        return values[mid]
+    return (values[mid - 1] + values[mid]) / 2
+
+@dataclass(**_DATACLASS_SLOTS)
+class _SessionColumns:
+    """Per-flow session summaries stored column-wise (index i describes session i)"""
+    message_counts: array = field(default_factory=lambda: array('q'))
+    start_days: List[str] = field(default_factory=list)
+    durations_minutes: array = field(default_factory=lambda: array('d'))
+    
+    # Session length buckets, tallied as rows arrive: <= 2, 3-10 and > 10 messages
+    short_sessions: int = 0
+    medium_sessions: int = 0
+    long_sessions: int = 0
+    
+    def append(self, row) -> None:
+        """Append one session summary row (message_count, start_day, duration_minutes)"""
+        message_count = row['message_count']
+        self.message_counts.append(message_count)
+        self.start_days.append(row['start_day'])
+        self.durations_minutes.append(row['duration_minutes'])
+        
+        if message_count <= 2:
+            self.short_sessions += 1
+        elif message_count <= 10:
+            self.medium_sessions += 1
+        else:
+            self.long_sessions += 1
+
 class FlowAnalyzer:
     """Advanced flow intelligence analyzer for admin optimization"""
     
-    def __init__(self, database_path: str = "/home/jgi/.flowise/database.sqlite"):
+    def __init__(self, database_path: str = "/home/jgi/.flowise/database.sqlite",
+                 cache_dir: Optional[str] = None):
         self.db = FlowiseDBInterface(database_path)
+        # Optional on-disk cache for global reports (disabled unless a directory is given)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.flow_stats = None
         self.conversation_patterns = None
+        # (database fingerprint, reports) from the last analyze_all_flows run
+        self._reports_cache: Optional[Tuple[Tuple[int, ...], Dict[str, FlowPerformanceReport]]] = None
+    
+    def close(self) -> None:
+        """Release the underlying database connections"""
+        self.db.close()
         
     def analyze_all_flows(self) -> Dict[str, FlowPerformanceReport]:
-        """Analyze all flows and generate performance reports"""
+        """Analyze all flows and generate performance reports
+        
+        Results are reused until the database file (or its WAL) changes.
+        """
+        fingerprint = self.db.data_fingerprint()
+        if self._reports_cache and self._reports_cache[0] == fingerprint:
+            logger.info("♻️ Reusing flow analysis (database unchanged)")
+            return dict(self._reports_cache[1])
+        
         logger.info("🔍 Analyzing all flows for performance optimization...")
         
         # Get fresh data
         self.flow_stats = self.db.get_flow_statistics()
-        self.conversation_patterns = self.db.extract_conversation_patterns()
+        
+        # Pattern extraction (reusing the statistics) runs on a worker while the metrics load
+        patterns_future = self.db.submit(self.db.extract_conversation_patterns, flow_stats=self.flow_stats)
         
         reports = {}
         
@@ -79,18 +160,132 @@ class FlowAnalyzer:
         
         logger.info(f"📊 Found {len(significant_flows)} flows with significant usage")
         
+        # Fetch analysis inputs for every significant flow in a few grouped scans
+        flow_metrics = self._load_flow_metrics([stat.chatflow_id for stat in significant_flows])
+        self.conversation_patterns = patterns_future.result()
+        
         for flow_stat in significant_flows:
             try:
-                report = self._analyze_single_flow(flow_stat)
+                report = self._analyze_single_flow(
+                    flow_stat, flow_metrics.get(flow_stat.chatflow_id, self._empty_flow_metrics())
+                )
                 reports[flow_stat.flow_name] = report
                 logger.info(f"✅ Analyzed {flow_stat.flow_name}: {report.performance_score:.2f} score")
             except Exception as e:
                 logger.error(f"❌ Failed to analyze {flow_stat.flow_name}: {e}")
         
-        return reports
+        self._reports_cache = (fingerprint, reports)
+        return dict(reports)
+    
+    @staticmethod
+    def _empty_flow_metrics() -> Dict[str, Any]:
+        """Metric slices for a flow with no matching rows"""
+        return {'peak_hours': [], 'sessions': _SessionColumns(), 'quality': [], 'problematic': []}
+    
+    def _load_flow_metrics(self, flow_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Run the per-flow analysis queries once for all flows, grouped by chatflowid
+        
+        Returns flow_id -> {'peak_hours', 'sessions', 'quality', 'problematic'} slices
+        (hour ints, row lists, sessions held column-wise), replacing several
+        chatflowid-filtered queries per flow.
+        """
+        if not flow_ids:
+            return {}
+        
+        placeholders = ", ".join("?" for _ in flow_ids)
+        params = tuple(flow_ids)
+        
+        # Top 3 usage hours per flow: the hourly histogram is built and ranked once,
+        # inside SQLite, for both usage and timing analysis (ties go to the earlier hour)
+        peak_hours_query = f"""
+        SELECT chatflowid, hour
+        FROM (
+            SELECT chatflowid, CAST(strftime('%H', createdDate) AS INTEGER) as hour,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY chatflowid ORDER BY COUNT(*) DESC, strftime('%H', createdDate)
+                   ) as hour_rank
+            FROM chat_message 
+            WHERE chatflowid IN ({placeholders})
+            GROUP BY chatflowid, strftime('%H', createdDate)
+        )
+        WHERE hour_rank <= 3
+        ORDER BY chatflowid, hour_rank
+        """
+        
+        # One row per session: feeds session lengths, completion and durations.
+        # Timestamps are reduced in SQLite (ISO date prefix, julianday difference rounded
+        # to the stored millisecond precision) so no Python datetime objects are built.
+        session_query = f"""
+        SELECT chatflowid, sessionId, COUNT(*) as message_count,
+               substr(MIN(createdDate), 1, 10) as start_day,
+               ROUND((julianday(MAX(createdDate)) - julianday(MIN(createdDate))) * 86400000)
+                   / 1000.0 / 60 as duration_minutes
+        FROM chat_message 
+        WHERE chatflowid IN ({placeholders}) AND sessionId IS NOT NULL
+        GROUP BY chatflowid, sessionId
+        ORDER BY chatflowid, sessionId
+        """
+        
+        # User vs API message breakdown as one conditional aggregate row per flow
+        quality_query = f"""
+        SELECT chatflowid,
+               COUNT(CASE WHEN role = 'userMessage' THEN 1 END) as user_messages,
+               COUNT(CASE WHEN role = 'apiMessage' THEN 1 END) as api_messages,
+               COALESCE(AVG(CASE WHEN role = 'userMessage' THEN length(content) END), 0) as user_avg_length
+        FROM chat_message 
+        WHERE chatflowid IN ({placeholders})
+        GROUP BY chatflowid
+        """
+        
+        # The 20 earliest user messages per flow from short (<= 2 message) sessions, reduced
+        # to per-message flags inside SQLite so message content never reaches Python
+        problematic_query = f"""
+        WITH short_sessions AS (
+            SELECT chatflowid, sessionId
+            FROM chat_message 
+            WHERE chatflowid IN ({placeholders}) AND sessionId IS NOT NULL
+            GROUP BY chatflowid, sessionId 
+            HAVING COUNT(*) <= 2
+        )
+        SELECT chatflowid, sessionId,
+               {_CONFUSION_MATCH_SQL} as is_confused,
+               (length(content) < 10) as is_short
+        FROM (
+            SELECT m.chatflowid, m.content, m.sessionId,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY m.chatflowid ORDER BY m.createdDate, m.id
+                   ) as row_num
+            FROM chat_message m
+            JOIN short_sessions s ON s.chatflowid = m.chatflowid AND s.sessionId = m.sessionId
+            WHERE m.chatflowid IN ({placeholders})
+            AND m.role = 'userMessage'
+        )
+        WHERE row_num <= 20
+        """
+        
+        metrics = defaultdict(self._empty_flow_metrics)
+        # The grouped scans are independent: run them concurrently on the DB worker pool
+        peak_hours_future = self.db.submit(self.db._execute_query, peak_hours_query, params)
+        row_futures = [
+            (key, self.db.submit(self.db._execute_query, query, query_params))
+            for key, query, query_params in (
+                ('sessions', session_query, params),
+                ('quality', quality_query, params),
+                ('problematic', problematic_query, params + params),
+            )
+        ]
+        
+        for row in peak_hours_future.result():
+            metrics[row['chatflowid']]['peak_hours'].append(row['hour'])
+        
+        for key, future in row_futures:
+            for row in future.result():
+                metrics[row['chatflowid']][key].append(row)
+        
+        return dict(metrics)
     
-    def _analyze_single_flow(self, flow_stat: FlowStats) -> FlowPerformanceReport:
-        """Analyze a single flow comprehensively"""
+    def _analyze_single_flow(self, flow_stat: FlowStats, metrics: Dict[str, Any]) -> FlowPerformanceReport:
+        """Analyze a single flow comprehensively from its pre-fetched metric slices"""
         
         # Get conversation patterns for this flow
         flow_patterns = [
@@ -99,16 +294,16 @@ class FlowAnalyzer:
         ]
         
         # Usage analysis
-        usage_metrics = self._analyze_usage_patterns(flow_stat)
+        usage_metrics = self._analyze_usage_patterns(flow_stat, metrics)
         
         # Quality analysis
-        quality_metrics = self._analyze_quality_indicators(flow_stat)
+        quality_metrics = self._analyze_quality_indicators(flow_stat, metrics)
         
         # Content analysis
-        content_analysis = self._analyze_content_patterns(flow_stat, flow_patterns)
+        content_analysis = self._analyze_content_patterns(flow_stat, flow_patterns, metrics)
         
         # Timing analysis
-        timing_analysis = self._analyze_timing_patterns(flow_stat)
+        timing_analysis = self._analyze_timing_patterns(flow_stat, metrics, usage_metrics['peak_hours'])
         
         # Generate recommendations
         recommendations = self._generate_recommendations(
@@ -153,72 +348,39 @@ class FlowAnalyzer:
             technical_improvements=recommendations['technical']
         )
     
-    def _analyze_usage_patterns(self, flow_stat: FlowStats) -> Dict[str, Any]:
+    def _analyze_usage_patterns(self, flow_stat: FlowStats, metrics: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze usage patterns for a flow"""
         
-        # Get hourly usage distribution
-        hourly_query = """
-        SELECT strftime('%H', createdDate) as hour, COUNT(*) as count
-        FROM chat_message 
-        WHERE chatflowid = ?
-        GROUP BY strftime('%H', createdDate)
-        ORDER BY count DESC
-        """
-        hourly_usage = self.db._execute_query(hourly_query, (flow_stat.chatflow_id,))
-        
-        # Session distribution analysis
-        session_query = """
-        SELECT sessionId, COUNT(*) as message_count,
-               MIN(createdDate) as start_time,
-               MAX(createdDate) as end_time
-        FROM chat_message 
-        WHERE chatflowid = ? AND sessionId IS NOT NULL
-        GROUP BY sessionId
-        """
-        session_data = self.db._execute_query(session_query, (flow_stat.chatflow_id,))
-        
-        session_lengths = [s['message_count'] for s in session_data]
+        # Per-session summaries
+        sessions = metrics['sessions']
         
         return {
-            'peak_hours': [int(h['hour']) for h in hourly_usage[:3]],
+            'peak_hours': list(metrics['peak_hours']),
             'session_length_distribution': {
-                'short_sessions': len([s for s in session_lengths if s <= 2]),
-                'medium_sessions': len([s for s in session_lengths if 3 <= s <= 10]),
-                'long_sessions': len([s for s in session_lengths if s > 10])
+                'short_sessions': sessions.short_sessions,
+                'medium_sessions': sessions.medium_sessions,
+                'long_sessions': sessions.long_sessions
             },
-            'session_lengths': session_lengths,
-            'total_active_days': len(set([
-                datetime.fromisoformat(s['start_time'].replace('Z', '+00:00')).date()
-                for s in session_data
-            ]))
+            'session_lengths': list(sessions.message_counts),
+            'total_active_days': len(set(sessions.start_days))
         }
     
-    def _analyze_quality_indicators(self, flow_stat: FlowStats) -> Dict[str, Any]:
+    def _analyze_quality_indicators(self, flow_stat: FlowStats, metrics: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze quality indicators for a flow"""
         
         # User vs API message ratio analysis
-        message_query = """
-        SELECT role, COUNT(*) as count, AVG(length(content)) as avg_length
-        FROM chat_message 
-        WHERE chatflowid = ?
-        GROUP BY role
-        """
-        message_breakdown = self.db._execute_query(message_query, (flow_stat.chatflow_id,))
+        if metrics['quality']:
+            breakdown = metrics['quality'][0]
+            user_messages = breakdown['user_messages']
+            api_messages = breakdown['api_messages']
+            user_avg_length = breakdown['user_avg_length']
+        else:
+            user_messages = api_messages = user_avg_length = 0
         
-        user_messages = next((m['count'] for m in message_breakdown if m['role'] == 'userMessage'), 0)
-        api_messages = next((m['count'] for m in message_breakdown if m['role'] == 'apiMessage'), 0)
-        user_avg_length = next((m['avg_length'] for m in message_breakdown if m['role'] == 'userMessage'), 0)
-        
-        # Session completion analysis (sessions with follow-up)
-        completion_query = """
-        SELECT sessionId, COUNT(*) as turns
-        FROM chat_message 
-        WHERE chatflowid = ? AND sessionId IS NOT NULL
-        GROUP BY sessionId
-        HAVING turns > 2
-        """
-        completed_sessions = self.db._execute_query(completion_query, (flow_stat.chatflow_id,))
-        completion_rate = len(completed_sessions) / max(flow_stat.session_count, 1)
+        # Session completion analysis (sessions with follow-up, i.e. more than 2 messages)
+        sessions = metrics['sessions']
+        completed_sessions = sessions.medium_sessions + sessions.long_sessions
+        completion_rate = completed_sessions / max(flow_stat.session_count, 1)
         
         # Look for satisfaction indicators
         satisfaction_indicators = []
@@ -236,37 +398,21 @@ class FlowAnalyzer:
             'satisfaction_indicators': satisfaction_indicators
         }
     
-    def _analyze_content_patterns(self, flow_stat: FlowStats, patterns: List[ConversationPattern]) -> Dict[str, Any]:
+    def _analyze_content_patterns(self, flow_stat: FlowStats, patterns: List[ConversationPattern],
+                                  metrics: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze content patterns for optimization opportunities"""
         
-        # Extract successful keywords from patterns
-        successful_keywords = []
-        common_patterns = []
+        # Extract successful keywords from patterns (deduplicated as they accumulate)
+        successful_keywords = set()
+        common_patterns = set()
         
         for pattern in patterns:
             if pattern.confidence > 0.5:
-                successful_keywords.extend(pattern.context_keywords)
-                common_patterns.append(pattern.pattern_type)
+                successful_keywords.update(pattern.context_keywords)
+                common_patterns.add(pattern.pattern_type)
         
-        # Analyze failed or low-engagement conversations
-        problematic_query = """
-        SELECT content, sessionId
-        FROM chat_message 
-        WHERE chatflowid = ? 
-        AND role = 'userMessage'
-        AND sessionId IN (
-            SELECT sessionId 
-            FROM chat_message 
-            WHERE chatflowid = ? AND sessionId IS NOT NULL
-            GROUP BY sessionId 
-            HAVING COUNT(*) <= 2
-        )
-        LIMIT 20
-        """
-        problematic_messages = self.db._execute_query(
-            problematic_query, 
-            (flow_stat.chatflow_id, flow_stat.chatflow_id)
-        )
+        # Analyze failed or low-engagement conversations (user messages from short sessions)
+        problematic_messages = metrics['problematic']
         
         # Identify potential content gaps
         content_gaps = []
@@ -275,65 +421,43 @@ class FlowAnalyzer:
         if flow_stat.avg_messages_per_session < 3:
             content_gaps.append("insufficient_follow_up_prompting")
         
-        problematic_patterns = []
+        problematic_patterns = set()
         for msg in problematic_messages:
-            content_lower = msg['content'].lower()
-            if any(word in content_lower for word in ['unclear', 'confused', 'wrong', 'error']):
-                problematic_patterns.append("confusion_indicators")
-            if len(content_lower) < 10:
-                problematic_patterns.append("very_short_queries")
+            if msg['is_confused']:
+                problematic_patterns.add("confusion_indicators")
+            if msg['is_short']:
+                problematic_patterns.add("very_short_queries")
         
+        # Sorted so reports do not depend on set iteration order
         return {
-            'successful_keywords': list(set(successful_keywords)),
-            'common_patterns': list(set(common_patterns)),
-            'problematic_patterns': list(set(problematic_patterns)),
+            'successful_keywords': sorted(successful_keywords),
+            'common_patterns': sorted(common_patterns),
+            'problematic_patterns': sorted(problematic_patterns),
             'content_gaps': content_gaps
         }
     
-    def _analyze_timing_patterns(self, flow_stat: FlowStats) -> Dict[str, Any]:
-        """Analyze timing and response patterns"""
-        
-        # Session duration analysis
-        duration_query = """
-        SELECT 
-            sessionId,
-            MIN(createdDate) as start_time,
-            MAX(createdDate) as end_time,
-            COUNT(*) as message_count
-        FROM chat_message 
-        WHERE chatflowid = ? AND sessionId IS NOT NULL
-        GROUP BY sessionId
-        HAVING message_count > 1
-        """
-        session_durations = self.db._execute_query(duration_query, (flow_stat.chatflow_id,))
-        
-        durations_minutes = []
-        for session in session_durations:
-            start = datetime.fromisoformat(session['start_time'].replace('Z', '+00:00'))
-            end = datetime.fromisoformat(session['end_time'].replace('Z', '+00:00'))
-            duration = (end - start).total_seconds() / 60
-            durations_minutes.append(duration)
-        
-        # Peak usage hours
-        hourly_query = """
-        SELECT strftime('%H', createdDate) as hour, COUNT(*) as count
-        FROM chat_message 
-        WHERE chatflowid = ?
-        GROUP BY hour
-        ORDER BY count DESC
-        LIMIT 3
+    def _analyze_timing_patterns(self, flow_stat: FlowStats, metrics: Dict[str, Any],
+                                 peak_hours: List[int]) -> Dict[str, Any]:
+        """Analyze timing and response patterns
+        
+        ``peak_hours`` is the list already computed by _analyze_usage_patterns.
         """
-        peak_hours = [
-            int(row['hour']) 
-            for row in self.db._execute_query(hourly_query, (flow_stat.chatflow_id,))
-        ]
+        
+        # Session duration analysis (multi-message sessions only)
+        sessions = metrics['sessions']
+        
+        durations_minutes = sorted(
+            duration
+            for count, duration in zip(sessions.message_counts, sessions.durations_minutes)
+            if count > 1
+        )
         
         duration_stats = {}
         if durations_minutes:
             duration_stats = {
-                'avg_minutes': statistics.mean(durations_minutes),
-                'median_minutes': statistics.median(durations_minutes),
-                'max_minutes': max(durations_minutes),
+                'avg_minutes': math.fsum(durations_minutes) / len(durations_minutes),
+                'median_minutes': _median_of_sorted(durations_minutes),
+                'max_minutes': durations_minutes[-1],
                 'sessions_analyzed': len(durations_minutes)
             }
         
@@ -349,30 +473,20 @@ class FlowAnalyzer:
                                    content_analysis: Dict[str, Any]) -> float:
         """Calculate overall performance score (0-1 scale)"""
         
-        # Base scores from flow stats
-        engagement_score = flow_stat.engagement_score
-        success_score = flow_stat.success_score
-        
-        # Usage score (based on session distribution and activity)
-        usage_score = min(1.0, usage_metrics['total_active_days'] / 30.0)  # 30-day ideal
-        
-        # Quality score (completion rate and user satisfaction)
-        quality_score = quality_metrics['completion_rate']
-        
-        # Content score (successful patterns vs problematic ones)
-        content_score = len(content_analysis['successful_keywords']) / 10.0  # 10 keywords ideal
-        content_score = min(1.0, content_score)
-        
-        # Weighted average
-        performance_score = (
-            engagement_score * 0.25 +
-            success_score * 0.25 +
-            usage_score * 0.20 +
-            quality_score * 0.15 +
-            content_score * 0.15
+        components = (
+            # Base scores from flow stats
+            flow_stat.engagement_score,
+            flow_stat.success_score,
+            # Usage score (based on session distribution and activity, 30-day ideal)
+            min(1.0, usage_metrics['total_active_days'] / 30.0),
+            # Quality score (completion rate and user satisfaction)
+            quality_metrics['completion_rate'],
+            # Content score (successful patterns vs problematic ones, 10 keywords ideal)
+            min(1.0, len(content_analysis['successful_keywords']) / 10.0),
         )
         
-        return min(1.0, performance_score)
+        # Weighted average
+        return min(1.0, sum(map(operator.mul, components, _PERFORMANCE_WEIGHTS)))
     
     def _generate_recommendations(self, 
                                 flow_stat: FlowStats, 
@@ -428,21 +542,89 @@ class FlowAnalyzer:
             'technical': technical
         }
     
-    def generate_global_intelligence_report(self) -> Dict[str, Any]:
-        """Generate system-wide intelligence report for flow optimization"""
+    def generate_global_intelligence_report(self, reports: Optional[Dict[str, FlowPerformanceReport]] = None) -> Dict[str, Any]:
+        """Generate system-wide intelligence report for flow optimization
+        
+        Pass ``reports`` from a previous analyze_all_flows() call to skip re-analysis.
+        With a ``cache_dir``, the report is served from disk while the database is unchanged.
+        """
+        
+        if reports is not None:
+            return self._build_global_report(reports)
+        
+        if self.cache_dir is None:
+            return self._build_global_report(self.analyze_all_flows())
+        
+        cache_path = self._global_report_cache_path()
+        data_key = self._global_report_data_key()
+        report = self._read_global_report_cache(cache_path, data_key)
+        if report is not None:
+            return report
+        
+        report = self._build_global_report(self.analyze_all_flows())
+        self._write_global_report_cache(cache_path, data_key, report)
+        return report
+    
+    def _global_report_cache_path(self) -> Path:
+        """Cache file for this database (one file per database, overwritten as it changes)"""
+        key = hashlib.blake2b(str(self.db.database_path.resolve()).encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"global_report_{key}.json"
+    
+    def _global_report_data_key(self) -> str:
+        """Token identifying the database contents a cached report was built from"""
+        row_count = self.db._execute_query("SELECT COUNT(*) FROM chat_message")
+        return ":".join((
+            ":".join(map(str, self.db.data_fingerprint())),
+            str(row_count[0][0] if row_count else 0),
+            _GLOBAL_REPORT_CACHE_VERSION,
+        ))
+    
+    def _read_global_report_cache(self, cache_path: Path, data_key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached global report if it was built from the current database contents"""
+        try:
+            with open(cache_path) as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable global report cache {cache_path}: {e}")
+            return None
+        
+        if not isinstance(entry, dict) or entry.get('data_key') != data_key:
+            return None
+        
+        logger.info(f"♻️ Reusing cached global report {cache_path.name}")
+        report = entry['report']
+        # The analysis still holds for the unchanged data; stamp it as of this call
+        report['analysis_timestamp'] = datetime.now().isoformat()
+        return report
+    
+    def _write_global_report_cache(self, cache_path: Path, data_key: str, report: Dict[str, Any]) -> None:
+        """Atomically write a global report to the cache (failures only log a warning)"""
+        import tempfile
         
-        reports = self.analyze_all_flows()
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".global_report_", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump({'data_key': data_key, 'report': report}, f)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write global report cache {cache_path}: {e}")
+    
+    def _build_global_report(self, reports: Dict[str, FlowPerformanceReport]) -> Dict[str, Any]:
+        """Aggregate per-flow reports into the system-wide report"""
         
         # Overall system metrics
         total_flows = len(reports)
         avg_performance = sum(r.performance_score for r in reports.values()) / max(total_flows, 1)
         
         # Top performing flows
-        top_performers = sorted(
-            reports.values(), 
-            key=lambda x: x.performance_score, 
-            reverse=True
-        )[:5]
+        top_performers = heapq.nlargest(5, reports.values(), key=lambda x: x.performance_score)
         
         # Flows needing attention
         needs_attention = [
@@ -459,26 +641,10 @@ class FlowAnalyzer:
             all_recommendations.extend(report.recommendations)
         
         # Most common success keywords
-        keyword_counts = defaultdict(int)
-        for keyword in all_successful_keywords:
-            keyword_counts[keyword] += 1
-        
-        common_success_patterns = sorted(
-            keyword_counts.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )[:10]
+        common_success_patterns = Counter(all_successful_keywords).most_common(10)
         
         # Most common recommendations
-        recommendation_counts = defaultdict(int)
-        for rec in all_recommendations:
-            recommendation_counts[rec] += 1
-        
-        common_recommendations = sorted(
-            recommendation_counts.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:5]
+        common_recommendations = Counter(all_recommendations).most_common(5)
         
         return {
             'system_overview': {
@@ -531,22 +697,24 @@ def main():
     parser.add_argument("--global-report", action="store_true", help="Generate global intelligence report")
     parser.add_argument("--export", help="Export analysis to JSON file")
     parser.add_argument("--top", type=int, default=5, help="Show top N performing flows")
+    parser.add_argument("--cache-dir", help="Reuse global reports cached in this directory while the database is unchanged")
     
     args = parser.parse_args()
     
+    analyzer = None
     try:
-        analyzer = FlowAnalyzer(args.database)
+        analyzer = FlowAnalyzer(args.database, cache_dir=args.cache_dir)
         
         if args.global_report:
             logger.info("🌍 Generating global intelligence report...")
             report = analyzer.generate_global_intelligence_report()
             
             if args.export:
-                with open(args.export, 'w') as f:
-                    json.dump(report, f, indent=2, default=str)
+                with open(args.export, 'wb') as f:
+                    f.write(_dumps_report(report))
                 print(f"✅ Global report exported to {args.export}")
             else:
-                print(json.dumps(report, indent=2, default=str))
+                print(_dumps_report(report).decode())
                 
         elif args.flow:
             reports = analyzer.analyze_all_flows()
@@ -566,11 +734,7 @@ def main():
             # Default: show top performing flows
             reports = analyzer.analyze_all_flows()
             
-            top_flows = sorted(
-                reports.values(),
-                key=lambda x: x.performance_score,
-                reverse=True
-            )[:args.top]
+            top_flows = heapq.nlargest(args.top, reports.values(), key=lambda x: x.performance_score)
             
             print(f"🏆 Top {len(top_flows)} Performing Flows:")
             for i, report in enumerate(top_flows, 1):
@@ -584,6 +748,9 @@ def main():
         print(f"❌ Analysis failed: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        if analyzer is not None:
+            analyzer.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
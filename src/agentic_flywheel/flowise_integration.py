@@ -4,10 +4,10 @@ Flowise Integration Helper
 Provides easy integration with the user's Flowise server at beagle-emerging-gnu.ngrok-free.app
 """
 
-import asyncio
-import json
-import requests
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
+
+if TYPE_CHECKING:
+    import httpx
 
 # Optional import of MCP server - only if httpx is available
 try:
@@ -24,12 +24,40 @@ class FlowiseIntegrationHelper:
     def __init__(self, base_url: str = "https://beagle-emerging-gnu.ngrok-free.app"):
         self.base_url = base_url
         self.mcp_server = FlowiseMCPServer(flowise_base_url=base_url) if MCP_AVAILABLE else None
+        # Pooled keep-alive client, created on first use inside the running event loop
+        self._client: Optional["httpx.AsyncClient"] = None
+    
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """Shared HTTP client reusing connections to the Flowise server."""
+        if self._client is None or self._client.is_closed:
+            # Imported on first use so importing the package stays cheap
+            import httpx
+            
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=30,
+                limits=httpx.Limits(max_keepalive_connections=16)
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def __aenter__(self) -> "FlowiseIntegrationHelper":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
         
     async def test_connection(self) -> Dict[str, Any]:
         """Test connection to the Flowise server."""
         try:
             # Test with example flow from comment
-            response = requests.get(f"{self.base_url}/api/v1/chatflows", timeout=10)
+            response = await self.client.get("/api/v1/chatflows", timeout=10)
             if response.status_code == 200:
                 flows = response.json() if response.text else []
                 return {
@@ -63,11 +91,10 @@ class FlowiseIntegrationHelper:
                 }
             }
             
-            response = requests.post(
-                f"{self.base_url}/api/v1/prediction/{example_flow_id}",
+            response = await self.client.post(
+                f"/api/v1/prediction/{example_flow_id}",
                 json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=30
+                headers={"Content-Type": "application/json"}
             )
             
             if response.status_code == 200:
@@ -110,25 +137,25 @@ class FlowiseIntegrationHelper:
 
 async def test_user_server():
     """Test function for the user's Flowise server integration."""
-    helper = FlowiseIntegrationHelper()
-    
-    print("🔗 Testing connection to beagle-emerging-gnu.ngrok-free.app...")
-    connection_test = await helper.test_connection()
-    print(f"Connection status: {connection_test}")
-    
-    if connection_test.get("status") == "connected":
-        print("\n🚀 Testing example flow with a sample question...")
-        query_result = await helper.query_example_flow(
-            "How can AI enhance creativity in research?", 
-            max_messages=5
-        )
-        print(f"Query result status: {query_result.get('status')}")
-        if query_result.get("status") == "success":
-            response_text = query_result["response"].get("text", "No text response")
-            print(f"Response preview: {response_text[:200]}...")
-        else:
-            print(f"Query error: {query_result.get('message')}")
+    async with FlowiseIntegrationHelper() as helper:
+        print("🔗 Testing connection to beagle-emerging-gnu.ngrok-free.app...")
+        connection_test = await helper.test_connection()
+        print(f"Connection status: {connection_test}")
+        
+        if connection_test.get("status") == "connected":
+            print("\n🚀 Testing example flow with a sample question...")
+            query_result = await helper.query_example_flow(
+                "How can AI enhance creativity in research?", 
+                max_messages=5
+            )
+            print(f"Query result status: {query_result.get('status')}")
+            if query_result.get("status") == "success":
+                response_text = query_result["response"].get("text", "No text response")
+                print(f"Response preview: {response_text[:200]}...")
+            else:
+                print(f"Query error: {query_result.get('message')}")
 
 
 if __name__ == "__main__":
+    import asyncio
     asyncio.run(test_user_server())
\ No newline at end of file
@@ -0,0 +1,13 @@
+"""Shared fixtures for the agentic flywheel tests"""
+
+import pytest
+
+from flowise_fixtures import sample_messages, write_flowise_db
+
+
+@pytest.fixture
+def flowise_db_path(tmp_path):
+    """Path to a Flowise database populated with ``sample_messages()``"""
+    path = tmp_path / "database.sqlite"
+    write_flowise_db(path, sample_messages())
+    return path
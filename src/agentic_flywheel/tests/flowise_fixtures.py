@@ -0,0 +1,98 @@
+"""Helpers for building small Flowise SQLite databases from explicit message rows"""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+# chat_message as created by Flowise's SQLite migrations
+FLOWISE_CHAT_MESSAGE_SCHEMA = """
+CREATE TABLE chat_message (
+    id varchar PRIMARY KEY NOT NULL,
+    role varchar NOT NULL,
+    chatflowid varchar NOT NULL,
+    content text NOT NULL,
+    sourceDocuments text,
+    usedTools text,
+    fileAnnotations text,
+    fileUploads text,
+    chatType varchar,
+    chatId varchar,
+    memoryType varchar,
+    sessionId varchar,
+    createdDate datetime NOT NULL DEFAULT (datetime('now')),
+    leadEmail text,
+    agentReasoning text,
+    action text,
+    artifacts text,
+    followUpPrompts text
+)
+"""
+
+CREATIVE_ORIENTATION_ID = "7d405a51-968d-4467-9ae6-d49bf182cdf9"
+UNKNOWN_FLOW_ID = "00000000-0000-0000-0000-000000000000"
+
+BASE_TIME = datetime(2024, 1, 1, 10, 0, 0)
+
+
+def flowise_timestamp(moment: datetime) -> str:
+    """Format a datetime the way Flowise stores createdDate"""
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def padded(text: str, width: int = 100) -> str:
+    """Pad message content to a fixed length so content-length scores are exact"""
+    return text.ljust(width, ".")
+
+
+def write_flowise_db(path, messages) -> None:
+    """Create a Flowise database at ``path``
+
+    ``messages`` is an iterable of (chatflowid, sessionId, role, content, createdDate) tuples.
+    """
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute(FLOWISE_CHAT_MESSAGE_SCHEMA)
+        conn.executemany(
+            "INSERT INTO chat_message (id, chatflowid, sessionId, role, content, createdDate) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(f"msg-{i}", *message) for i, message in enumerate(messages)],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def sample_messages():
+    """A creative-orientation flow that qualifies for pattern mining plus a small unknown flow"""
+    messages = []
+
+    def session(flow_id, session_id, start, turns):
+        for minute, (role, content) in enumerate(turns):
+            messages.append((flow_id, session_id, role, content,
+                             flowise_timestamp(start + timedelta(minutes=minute))))
+
+    reply = ("apiMessage", padded("Tell me more about that"))
+    session(CREATIVE_ORIENTATION_ID, "s-a1", BASE_TIME, [
+        ("userMessage", padded("I have a vision for a new studio")),
+        reply,
+        ("userMessage", padded("My vision is to write daily")),
+        reply,
+        ("userMessage", padded("The Goal is a dream home")),
+        ("userMessage", padded("I want to achieve balance")),
+        ("userMessage", padded("nothing related here at all")),
+    ])
+    session(CREATIVE_ORIENTATION_ID, "s-a2", BASE_TIME + timedelta(hours=1), [
+        ("userMessage", padded("a clear vision of community")),
+        reply,
+        ("userMessage", padded("I will achieve it soon")),
+        reply,
+        ("userMessage", padded("just chatting about the weather")),
+    ])
+    session(UNKNOWN_FLOW_ID, "s-b1", BASE_TIME + timedelta(days=1), [
+        ("userMessage", "hello there"),
+        ("apiMessage", "hi"),
+    ])
+    # Messages without a session are ignored by the statistics
+    messages.append((UNKNOWN_FLOW_ID, None, "userMessage", "orphan message",
+                     flowise_timestamp(BASE_TIME + timedelta(days=2))))
+    return messages
+
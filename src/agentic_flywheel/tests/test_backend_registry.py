@@ -0,0 +1,167 @@
+"""Tests for the backend registry's flow discovery cache and health monitor"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from backends import registry as registry_module
+from backends.base import BackendType
+from backends.registry import BackendRegistry
+
+
+class FakeBackend:
+    """Minimal connected backend that counts discovery and health-check calls"""
+
+    def __init__(self, backend_type: BackendType, healthy: bool = True):
+        self.backend_type = backend_type
+        self.is_connected = True
+        self.healthy = healthy
+        self.discover_calls = 0
+        self.health_calls = 0
+
+    async def discover_flows(self):
+        self.discover_calls += 1
+        return [SimpleNamespace(id=f"{self.backend_type.value}-{self.discover_calls}")]
+
+    async def health_check(self):
+        self.health_calls += 1
+        if self.healthy is None:
+            raise ConnectionError("backend unreachable")
+        return self.healthy
+
+    async def disconnect(self):
+        self.is_connected = False
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    # Patch only the registry's view of time so the event loop keeps its real clock
+    monkeypatch.setattr(registry_module, "time", SimpleNamespace(monotonic=fake.monotonic))
+    return fake
+
+
+@pytest.fixture
+def registry():
+    backend_registry = BackendRegistry()
+    backend_registry.backends = {
+        BackendType.FLOWISE: FakeBackend(BackendType.FLOWISE),
+        BackendType.LANGFLOW: FakeBackend(BackendType.LANGFLOW),
+    }
+    return backend_registry
+
+
+def _flow_ids(discovered):
+    return {backend_type: [flow.id for flow in flows] for backend_type, flows in discovered.items()}
+
+
+def test_discover_all_flows_reuses_results_within_ttl(registry, clock):
+    first = asyncio.run(registry.discover_all_flows())
+    clock.now += BackendRegistry.FLOWS_CACHE_TTL - 1
+    second = asyncio.run(registry.discover_all_flows())
+
+    assert _flow_ids(first) == _flow_ids(second) == {
+        BackendType.FLOWISE: ["flowise-1"],
+        BackendType.LANGFLOW: ["langflow-1"],
+    }
+    assert [backend.discover_calls for backend in registry.backends.values()] == [1, 1]
+
+
+def test_discover_all_flows_rediscovers_after_ttl(registry, clock):
+    asyncio.run(registry.discover_all_flows())
+    clock.now += BackendRegistry.FLOWS_CACHE_TTL
+    discovered = asyncio.run(registry.discover_all_flows())
+
+    assert _flow_ids(discovered)[BackendType.FLOWISE] == ["flowise-2"]
+    assert [backend.discover_calls for backend in registry.backends.values()] == [2, 2]
+    assert set(registry._flows_cache) == {"flowise-1", "flowise-2", "langflow-1", "langflow-2"}
+
+
+def test_discover_all_flows_refresh_bypasses_cache(registry, clock):
+    asyncio.run(registry.discover_all_flows())
+    discovered = asyncio.run(registry.discover_all_flows(refresh=True))
+
+    assert _flow_ids(discovered)[BackendType.LANGFLOW] == ["langflow-2"]
+    assert [backend.discover_calls for backend in registry.backends.values()] == [2, 2]
+
+
+def test_disconnected_backends_are_skipped(registry, clock):
+    asyncio.run(registry.discover_all_flows())
+    registry.backends[BackendType.LANGFLOW].is_connected = False
+
+    assert list(asyncio.run(registry.discover_all_flows())) == [BackendType.FLOWISE]
+
+
+async def _wait_for_health_checks(backend, count, timeout=2.0):
+    async def poll():
+        while backend.health_calls < count:
+            await asyncio.sleep(0.005)
+    await asyncio.wait_for(poll(), timeout)
+
+
+def test_health_monitor_polls_in_background(registry):
+    registry.backends[BackendType.CUSTOM] = FakeBackend(BackendType.CUSTOM, healthy=None)
+    registry.backends[BackendType.LANGFLOW].healthy = False
+
+    async def scenario():
+        registry.start_health_monitor(interval=0.01)
+        await _wait_for_health_checks(registry.backends[BackendType.CUSTOM], 2)
+        await registry.stop_health_monitor()
+
+    asyncio.run(scenario())
+
+    assert all(backend.health_calls >= 2 for backend in registry.backends.values())
+    assert registry._health_status == {
+        BackendType.FLOWISE: True,
+        BackendType.LANGFLOW: False,
+        BackendType.CUSTOM: False,
+    }
+    assert registry._health_monitor is None
+
+
+def test_starting_health_monitor_twice_keeps_one_task(registry):
+    async def scenario():
+        registry.start_health_monitor(interval=0.01)
+        monitor = registry._health_monitor
+        registry.start_health_monitor(interval=0.01)
+        assert registry._health_monitor is monitor
+
+        await _wait_for_health_checks(registry.backends[BackendType.FLOWISE], 3)
+        monitor_tasks = [
+            task for task in asyncio.all_tasks()
+            if task.get_coro().__qualname__.endswith("_health_monitor_loop")
+        ]
+        assert monitor_tasks == [monitor]
+
+        await registry.stop_health_monitor()
+        # Stopping again is a no-op
+        await registry.stop_health_monitor()
+        return monitor
+
+    monitor = asyncio.run(scenario())
+
+    assert monitor.cancelled()
+
+
+def test_disconnect_all_backends_cancels_health_monitor(registry):
+    async def scenario():
+        registry.start_health_monitor(interval=0.01)
+        monitor = registry._health_monitor
+        await _wait_for_health_checks(registry.backends[BackendType.FLOWISE], 1)
+        await registry.disconnect_all_backends()
+        return monitor
+
+    monitor = asyncio.run(scenario())
+
+    assert monitor.cancelled()
+    assert registry._health_monitor is None
+    assert not any(backend.is_connected for backend in registry.backends.values())
@@ -0,0 +1,177 @@
+"""Tests for the Flowise admin database interface"""
+
+import asyncio
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from flowise_fixtures import (
+    BASE_TIME, CREATIVE_ORIENTATION_ID, UNKNOWN_FLOW_ID, flowise_timestamp, padded, write_flowise_db
+)
+from flowise_admin.db_interface import FlowiseDBInterface
+
+
+@pytest.fixture
+def db(flowise_db_path):
+    with FlowiseDBInterface(str(flowise_db_path)) as interface:
+        yield interface
+
+
+def test_flow_statistics_scores_each_flow_in_sql(db):
+    creative, unknown = db.get_flow_statistics()
+
+    assert creative.chatflow_id == CREATIVE_ORIENTATION_ID
+    assert creative.flow_name == "creative-orientation"
+    assert creative.message_count == 12
+    assert creative.session_count == 2
+    assert creative.avg_messages_per_session == 6.0
+    assert creative.first_message == datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc)
+    assert creative.last_message == datetime(2024, 1, 1, 11, 4, tzinfo=timezone.utc)
+    assert creative.most_active_session == "s-a1"
+    # 8/12 user messages * 0.4 + (100 chars / 200) * 0.3 + min(2/12 * 10, 1) * 0.3
+    assert creative.success_score == pytest.approx(8 / 12 * 0.4 + 0.15 + 0.3)
+    assert creative.engagement_score == 1.0
+
+    # The session-less orphan message is excluded
+    assert unknown.chatflow_id == UNKNOWN_FLOW_ID
+    assert unknown.flow_name == "unknown"
+    assert unknown.message_count == 2
+    assert unknown.session_count == 1
+    assert unknown.success_score == pytest.approx(0.5 * 0.4 + 6.5 / 200 * 0.3 + 0.3)
+    assert unknown.engagement_score == pytest.approx(0.2)
+
+
+def test_keyword_patterns_count_case_insensitive_matches(db):
+    patterns = {pattern.pattern_type: pattern for pattern in db.extract_conversation_patterns()}
+
+    assert set(patterns) == {"vision_creation", "outcome_focus", "high_engagement"}
+
+    # A message matching several keywords of one pattern is counted once
+    vision = patterns["vision_creation"]
+    assert vision.flow_id == CREATIVE_ORIENTATION_ID
+    assert vision.usage_frequency == 4
+    assert vision.confidence == pytest.approx(4 / 20)
+    assert vision.examples == [
+        padded("a clear vision of community"),
+        padded("The Goal is a dream home"),
+        padded("My vision is to write daily"),
+        padded("I have a vision for a new studio"),
+    ]
+
+    outcome = patterns["outcome_focus"]
+    assert outcome.usage_frequency == 2
+    assert outcome.confidence == pytest.approx(2 / 20)
+    assert outcome.examples == [padded("I will achieve it soon"), padded("I want to achieve balance")]
+
+    engagement = patterns["high_engagement"]
+    assert engagement.confidence == 1.0
+    assert engagement.examples == ["Session s-a1"]
+    assert engagement.usage_frequency == 2
+
+
+def test_extract_patterns_reuses_supplied_statistics(db):
+    stats = db.get_flow_statistics()
+    assert db.extract_conversation_patterns(flow_stats=stats) == db.extract_conversation_patterns()
+    assert db.extract_conversation_patterns(flow_id=UNKNOWN_FLOW_ID, flow_stats=stats) == []
+
+
+def _without_timestamp(dashboard):
+    return {key: value for key, value in dashboard.items() if key != 'analysis_timestamp'}
+
+
+def test_dashboard_sync_call_works_inside_running_event_loop(db):
+    async def call_from_async_code():
+        return db.get_admin_dashboard_data(), await db.aget_admin_dashboard_data()
+
+    sync_dashboard, async_dashboard = asyncio.run(call_from_async_code())
+
+    assert _without_timestamp(sync_dashboard) == _without_timestamp(async_dashboard)
+    health = sync_dashboard['system_health']
+    assert health['total_messages'] == 14
+    assert health['total_flows'] == 2
+    assert [flow['name'] for flow in health['top_performing_flows']] == ["creative-orientation", "unknown"]
+    assert len(sync_dashboard['conversation_patterns']) == 3
+
+
+def _index_names(path):
+    conn = sqlite3.connect(path)
+    try:
+        return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")}
+    finally:
+        conn.close()
+
+
+def test_constructor_leaves_schema_alone_until_indexes_are_requested(flowise_db_path):
+    with FlowiseDBInterface(str(flowise_db_path)) as interface:
+        interface.get_admin_dashboard_data()
+        interface.search_conversations("vision")
+        assert _index_names(flowise_db_path) == set()
+
+        assert interface.ensure_admin_indexes() is True
+        assert _index_names(flowise_db_path) == {
+            "ix_cm_flow_role_len", "ix_cm_flow_session_created", "ix_cm_created_date"
+        }
+        # Idempotent
+        assert interface.ensure_admin_indexes() is True
+
+
+@pytest.mark.parametrize("term, pattern", [
+    ("vision", "%vision%"),
+    ("100%", "%100\\%%"),
+    ("snake_case", "%snake\\_case%"),
+    ("back\\slash", "%back\\\\slash%"),
+    ("plan*", "plan%"),
+    ("*case", "%case"),
+])
+def test_build_search_pattern(term, pattern):
+    assert FlowiseDBInterface._build_search_pattern(term) == pattern
+
+
+@pytest.fixture
+def search_db(tmp_path):
+    path = tmp_path / "search.sqlite"
+    contents = [
+        "100% done",
+        "1000 done",
+        "snake_case name",
+        "snakeXcase name",
+        "back\\slash path",
+        "Planning the week",
+        "my plan for today",
+    ]
+    write_flowise_db(path, [
+        (CREATIVE_ORIENTATION_ID, "s-1", "userMessage", content,
+         flowise_timestamp(BASE_TIME + timedelta(minutes=minute)))
+        for minute, content in enumerate(contents)
+    ])
+    with FlowiseDBInterface(str(path)) as interface:
+        yield interface
+
+
+@pytest.mark.parametrize("term, expected", [
+    # LIKE metacharacters in the term are matched literally
+    ("100%", ["100% done"]),
+    ("snake_case", ["snake_case name"]),
+    ("back\\slash", ["back\\slash path"]),
+    # Plain terms are case-insensitive substring matches, newest first
+    ("PLAN", ["my plan for today", "Planning the week"]),
+    # '*' anchors the rest of the term as a wildcard pattern
+    ("plan*", ["Planning the week"]),
+    ("*done", ["1000 done", "100% done"]),
+])
+def test_search_conversations_escapes_like_metacharacters(search_db, term, expected):
+    messages = search_db.search_conversations(term)
+    assert [message.content for message in messages] == expected
+    assert all(message.flow_name == "creative-orientation" for message in messages)
+
+
+def test_reads_leave_database_file_and_journal_mode_untouched(flowise_db_path):
+    original = flowise_db_path.read_bytes()
+
+    with FlowiseDBInterface(str(flowise_db_path)) as interface:
+        interface.get_admin_dashboard_data()
+        assert interface._get_connection().execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+
+    assert flowise_db_path.read_bytes() == original
+    assert not flowise_db_path.with_name(flowise_db_path.name + "-wal").exists()
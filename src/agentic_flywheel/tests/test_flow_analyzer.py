@@ -0,0 +1,194 @@
+"""Tests for the flow analyzer's grouped metric queries and reports"""
+
+import json
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from flowise_fixtures import CREATIVE_ORIENTATION_ID, flowise_timestamp, padded, write_flowise_db
+from flowise_admin.db_interface import FlowiseDBInterface
+from flowise_admin.flow_analyzer import FlowAnalyzer, FlowPerformanceReport, _PERFORMANCE_WEIGHTS
+
+FAITH2STORY_ID = "896f7eed-342e-4596-9429-6fb9b5fbd91b"
+
+
+def analyzer_messages():
+    """One analyzable flow (>= 20 messages) and one below the analysis threshold"""
+    messages = []
+
+    def session(flow_id, session_id, start, step_minutes, contents):
+        for i, content in enumerate(contents):
+            role = "userMessage" if i % 2 == 0 else "apiMessage"
+            messages.append((flow_id, session_id, role, content,
+                             flowise_timestamp(start + timedelta(minutes=i * step_minutes))))
+
+    def filler(count):
+        return [padded(f"message {i}", 200) for i in range(count)]
+
+    # Hours 08, 09, 11 and 14 each get six messages: the top-3 tie goes to the earliest hours
+    session(CREATIVE_ORIENTATION_ID, "s1", datetime(2024, 1, 1, 8, 0), 10, filler(8))  # 08 x6, 09 x2
+    session(CREATIVE_ORIENTATION_ID, "s2", datetime(2024, 1, 2, 14, 0), 5, filler(6))
+    session(CREATIVE_ORIENTATION_ID, "s3", datetime(2024, 1, 3, 11, 0), 1, filler(6))
+    # Short sessions feeding the problematic-message checks
+    session(CREATIVE_ORIENTATION_ID, "s4", datetime(2024, 1, 3, 9, 0), 30,
+            ["I am confused by this", padded("reply", 200)])
+    session(CREATIVE_ORIENTATION_ID, "s5", datetime(2024, 1, 4, 9, 45), 5,
+            ["ok", padded("reply", 200)])
+
+    session(FAITH2STORY_ID, "f1", datetime(2024, 1, 5, 12, 0), 1, ["a story", "reply"])
+    return messages
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    path = tmp_path / "database.sqlite"
+    write_flowise_db(path, analyzer_messages())
+    flow_analyzer = FlowAnalyzer(str(path), cache_dir=str(tmp_path / "cache"))
+    yield flow_analyzer
+    flow_analyzer.close()
+
+
+def test_load_flow_metrics_groups_rows_per_flow(analyzer):
+    metrics = analyzer._load_flow_metrics([CREATIVE_ORIENTATION_ID, FAITH2STORY_ID])
+
+    creative = metrics[CREATIVE_ORIENTATION_ID]
+    assert creative['peak_hours'] == [8, 9, 11]
+    assert list(creative['sessions'].message_counts) == [8, 6, 6, 2, 2]
+    assert creative['sessions'].start_days == ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-03", "2024-01-04"]
+    assert list(creative['sessions'].durations_minutes) == [70.0, 25.0, 5.0, 30.0, 5.0]
+    assert (creative['sessions'].short_sessions, creative['sessions'].medium_sessions,
+            creative['sessions'].long_sessions) == (2, 3, 0)
+
+    (quality,) = creative['quality']
+    assert (quality['user_messages'], quality['api_messages']) == (12, 12)
+    assert quality['user_avg_length'] == pytest.approx((10 * 200 + 21 + 2) / 12)
+
+    assert [(row['sessionId'], row['is_confused'], row['is_short']) for row in creative['problematic']] == [
+        ("s4", 1, 0),
+        ("s5", 0, 1),
+    ]
+
+    faith = metrics[FAITH2STORY_ID]
+    assert faith['peak_hours'] == [12]
+    assert [(row['sessionId'], row['is_short']) for row in faith['problematic']] == [("f1", 1)]
+
+
+def test_analyze_all_flows_pins_performance_report(analyzer):
+    reports = analyzer.analyze_all_flows()
+
+    # faith2story is below the 20-message analysis threshold
+    assert list(reports) == ["creative-orientation"]
+
+    engagement = (24 / 5 - 1) / 5
+    success = 12 / 24 * 0.4 + (22 * 200 + 21 + 2) / 24 / 200 * 0.3 + 0.3
+    components = (engagement, success, 4 / 30, 3 / 5, 4 / 10)
+    expected_score = sum(c * w for c, w in zip(components, _PERFORMANCE_WEIGHTS))
+
+    report = reports["creative-orientation"]
+    assert report == FlowPerformanceReport(
+        flow_id=CREATIVE_ORIENTATION_ID,
+        flow_name="creative-orientation",
+        performance_score=pytest.approx(expected_score),
+        recommendations=["Review and improve response clarity and specificity"],
+        total_messages=24,
+        total_sessions=5,
+        avg_session_length=4.8,
+        user_engagement=pytest.approx(engagement),
+        success_rate=pytest.approx(success),
+        completion_rate=0.6,
+        user_satisfaction_indicators=["detailed_user_queries", "high_follow_up_rate", "sustained_engagement"],
+        common_patterns=["high_engagement"],
+        successful_keywords=["clarification", "deeper", "follow-up", "more"],
+        problematic_patterns=["confusion_indicators", "very_short_queries"],
+        peak_usage_hours=[8, 9, 11],
+        avg_response_time=None,
+        session_duration_stats={
+            'avg_minutes': 27.0,
+            'median_minutes': 25.0,
+            'max_minutes': 70.0,
+            'sessions_analyzed': 5,
+        },
+        optimization_suggestions=[],
+        content_gaps=[],
+        technical_improvements=["Add clarification mechanisms for ambiguous queries"],
+    )
+
+
+def test_analyze_all_flows_reuses_results_while_database_unchanged(analyzer, monkeypatch):
+    first = analyzer.analyze_all_flows()
+
+    def fail(self):
+        raise AssertionError("flows were re-analyzed")
+
+    monkeypatch.setattr(FlowiseDBInterface, "get_flow_statistics", fail)
+    assert analyzer.analyze_all_flows() == first
+
+
+def _fail_analysis(self):
+    raise AssertionError("flows were re-analyzed")
+
+
+def _without_timestamp(report):
+    return {key: value for key, value in report.items() if key != 'analysis_timestamp'}
+
+
+def test_global_report_disk_cache_is_opt_in(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    path = tmp_path / "database.sqlite"
+    write_flowise_db(path, analyzer_messages())
+
+    flow_analyzer = FlowAnalyzer(str(path))
+    try:
+        assert flow_analyzer.cache_dir is None
+        flow_analyzer.generate_global_intelligence_report()
+    finally:
+        flow_analyzer.close()
+
+    assert not (tmp_path / "home").exists()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["database.sqlite"]
+
+
+def test_global_report_cache_hit_miss_and_invalidation(tmp_path, monkeypatch):
+    path = tmp_path / "database.sqlite"
+    cache_dir = tmp_path / "cache"
+    write_flowise_db(path, analyzer_messages())
+
+    # Miss: built from the database and written to a single per-database file
+    first_analyzer = FlowAnalyzer(str(path), cache_dir=str(cache_dir))
+    try:
+        built = first_analyzer.generate_global_intelligence_report()
+    finally:
+        first_analyzer.close()
+    assert built['system_overview']['total_flows_analyzed'] == 1
+    (cache_file,) = cache_dir.iterdir()
+
+    # Hit: a fresh analyzer serves the same JSON-native report without analyzing
+    monkeypatch.setattr(FlowAnalyzer, "analyze_all_flows", _fail_analysis)
+    second_analyzer = FlowAnalyzer(str(path), cache_dir=str(cache_dir))
+    try:
+        cached = second_analyzer.generate_global_intelligence_report()
+    finally:
+        second_analyzer.close()
+    assert _without_timestamp(cached) == _without_timestamp(built)
+    assert cached['analysis_timestamp'] >= built['analysis_timestamp']
+    monkeypatch.undo()
+
+    # Invalidation: new messages change the data key, and the same file is overwritten
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "INSERT INTO chat_message (id, chatflowid, sessionId, role, content, createdDate) "
+        "VALUES ('extra', ?, 's6', 'userMessage', 'a new question', '2024-02-01T10:00:00.000Z')",
+        (CREATIVE_ORIENTATION_ID,)
+    )
+    conn.commit()
+    conn.close()
+
+    third_analyzer = FlowAnalyzer(str(path), cache_dir=str(cache_dir))
+    try:
+        rebuilt = third_analyzer.generate_global_intelligence_report()
+    finally:
+        third_analyzer.close()
+    assert rebuilt['top_performers'][0]['total_messages'] == 25
+    assert list(cache_dir.iterdir()) == [cache_file]
+    assert json.loads(cache_file.read_text())['report']['top_performers'][0]['total_messages'] == 25
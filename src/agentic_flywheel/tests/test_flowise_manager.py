@@ -0,0 +1,123 @@
+"""Tests for FlowiseManager intent classification"""
+
+import itertools
+
+import pytest
+import yaml
+
+from agentic_flywheel import flowise_manager
+from agentic_flywheel.flowise_manager import FlowConfig, FlowiseManager
+
+REGISTRY = {
+    'operational_flows': {
+        'creative-orientation': {
+            'id': 'flow-creative', 'name': 'Creative Orientation', 'description': 'Creative work',
+            'active': 1, 'intent_keywords': ['vision', 'goal', 'create', 'desired outcome'],
+        },
+        'technical-analysis': {
+            'id': 'flow-technical', 'name': 'Technical Analysis', 'description': 'Code work',
+            'active': 1, 'intent_keywords': ['code', 'api', 'debug', 'architecture'],
+        },
+        'faith2story': {
+            'id': 'flow-story', 'name': 'Faith to Story', 'description': 'Narratives',
+            'active': 1, 'intent_keywords': ['story', 'journey', 'faith', 'create'],
+        },
+        'retired-flow': {
+            'id': 'flow-retired', 'name': 'Retired', 'description': 'Inactive',
+            'active': 0, 'intent_keywords': ['story'],
+        },
+    },
+}
+
+QUESTIONS = [
+    "",
+    "hello there",
+    "I have a VISION and a goal",
+    "debug the API architecture",
+    "tell me a story about my faith journey",
+    "create",  # shared keyword: the first flow with the best score wins
+    "a story to create a vision",
+    "desired outcome for the code",
+    "storytelling encoded apis",  # substring matches count
+]
+
+
+@pytest.fixture
+def registry_path(tmp_path):
+    path = tmp_path / "flow-registry.yaml"
+    path.write_text(yaml.safe_dump(REGISTRY))
+    return str(path)
+
+
+@pytest.fixture
+def manager(registry_path):
+    return FlowiseManager(flow_registry_path=registry_path)
+
+
+def test_classify_intent(manager):
+    assert [manager.classify_intent(question) for question in QUESTIONS] == [
+        "creative-orientation",
+        "creative-orientation",
+        "creative-orientation",
+        "technical-analysis",
+        "faith2story",
+        "creative-orientation",
+        "creative-orientation",
+        "creative-orientation",
+        "technical-analysis",
+    ]
+
+
+def test_flows_mapping_is_read_only(manager):
+    assert sorted(manager.flows) == ["creative-orientation", "faith2story", "technical-analysis"]
+    with pytest.raises(TypeError):
+        manager.flows["new-flow"] = manager.flows["faith2story"]
+
+
+def test_add_flow_refreshes_memoized_classification(manager):
+    assert manager.classify_intent("plan a podcast episode") == "creative-orientation"
+
+    manager.add_flow("podcast", FlowConfig(
+        id="flow-podcast", name="Podcast", description="Audio shows",
+        default_config={}, intent_keywords=["podcast", "episode"],
+    ))
+
+    assert manager.classify_intent("plan a podcast episode") == "podcast"
+
+
+def test_refresh_intent_index_after_in_place_keyword_edit(manager):
+    assert manager.classify_intent("review my essay") == "creative-orientation"
+
+    manager.flows["faith2story"].intent_keywords.append("essay")
+    manager.refresh_intent_index()
+
+    assert manager.classify_intent("review my essay") == "faith2story"
+
+
+def test_empty_keyword_matches_every_question(manager):
+    # The automaton cannot hold an empty keyword, so this falls back to the substring scan
+    manager.add_flow("catch-all", FlowConfig(
+        id="flow-catch-all", name="Catch-all", description="", default_config={}, intent_keywords=["", "story"],
+    ))
+    assert manager._intent_automaton is None
+    assert manager.classify_intent("no keywords at all") == "catch-all"
+    assert manager.classify_intent("a story") == "catch-all"
+    assert manager.classify_intent("debug the api code") == "technical-analysis"
+
+
+def test_classification_same_with_and_without_pyahocorasick(registry_path, monkeypatch):
+    pytest.importorskip("ahocorasick")
+    vocabulary = ["vision", "code", "story", "create", "api", "faith", "desired outcome", "the", "VISION"]
+    questions = QUESTIONS + [
+        " ".join(words) for words in itertools.product(vocabulary, repeat=3)
+    ]
+
+    with_automaton = FlowiseManager(flow_registry_path=registry_path)
+    assert with_automaton._intent_automaton is not None
+
+    monkeypatch.setattr(flowise_manager, "ahocorasick", None)
+    without_automaton = FlowiseManager(flow_registry_path=registry_path)
+    assert without_automaton._intent_automaton is None
+
+    for question in questions:
+        assert with_automaton.classify_intent(question) == without_automaton.classify_intent(question), question
@@ -88,9 +88,9 @@ class LangFuseTracer(BaseTracer):
         metadata: dict[str, Any] | None = None,
         vertex: Vertex | None = None,
     ) -> None:
-        start_time = datetime.now(tz=timezone.utc)
         if not self._ready:
             return
+        start_time = datetime.now(tz=timezone.utc)
 
         metadata_: dict = {"from_langflow_component": True, "component_id": trace_id}
         metadata_ |= {"trace_type": trace_type} if trace_type else {}
@@ -122,9 +122,9 @@ class LangFuseTracer(BaseTracer):
         error: Exception | None = None,
         logs: Sequence[Log | dict] = (),
     ) -> None:
-        end_time = datetime.now(tz=timezone.utc)
         if not self._ready:
             return
+        end_time = datetime.now(tz=timezone.utc)
 
         span = self.spans.pop(trace_id, None)
         if span: